@@ -1,6 +1,13 @@
-from importlib.metadata import version, PackageNotFoundError
+def __getattr__(name: str) -> str:
+    # Resolve the version lazily: importlib.metadata is slow to import and
+    # only needed for `lola --version`
+    if name == "__version__":
+        from importlib.metadata import version, PackageNotFoundError
 
-try:
-    __version__ = version("lola")
-except PackageNotFoundError:
-    __version__ = "unknown"
+        try:
+            value = version("lola")
+        except PackageNotFoundError:
+            value = "unknown"
+        globals()["__version__"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,6 +4,7 @@ Install CLI commands.
 Commands for installing, uninstalling, updating, and listing module installations.
 """
 
+from collections import defaultdict
 from dataclasses import dataclass, field
 import shutil
 from pathlib import Path
@@ -29,6 +30,7 @@ from lola.targets import (
     TARGETS,
     _get_content_path,
     _get_skill_description,
+    _install_assistant_files,
     _skill_source_dir,
     copy_module_to_local,
     get_registry,
@@ -39,6 +41,9 @@ from lola.utils import ensure_lola_dirs, get_local_modules_path
 
 console = Console()
 
+# Assistant names accepted by -a/--assistant, computed once at import
+ASSISTANT_NAMES = tuple(TARGETS.keys())
+
 
 def _fetch_from_marketplace(marketplace_name: str, module_name: str) -> Path:
     """
@@ -153,57 +158,51 @@ class UpdateContext:
     installed_skills: set[str] = field(default_factory=set)  # Actual installed names
 
 
-def _validate_installation_for_update(inst: Installation) -> tuple[bool, str | None]:
+def _load_update_source(inst: Installation) -> tuple[Module | None, str | None]:
     """
-    Validate that an installation can be updated.
+    Load and validate the registered module an installation is refreshed from.
+
+    Only the installation's module name, scope and project path are checked,
+    so the result can be shared by every assistant in the same group.
 
-    Returns (is_valid, error_message).
+    Returns (module, error_message); module is None if the installation
+    cannot be updated.
     """
     # Check if project path still exists for project-scoped installations
     if inst.scope == "project" and inst.project_path:
         if not Path(inst.project_path).exists():
-            return False, "project path no longer exists"
+            return None, "project path no longer exists"
 
     # For project scope, project_path is required
     if inst.scope == "project" and not inst.project_path:
-        return False, "project scope requires project path"
+        return None, "project scope requires project path"
 
     # Get the global module to refresh from
     global_module_path = MODULES_DIR / inst.module_name
     if not global_module_path.exists():
-        return False, "module not found in registry"
+        return None, "module not found in registry"
 
     global_module = Module.from_path(global_module_path)
     if not global_module:
-        return False, "invalid module"
+        return None, "invalid module"
 
     # Validate module structure and skill files
     is_valid, errors = global_module.validate()
     if not is_valid:
-        return False, f"validation errors: {', '.join(errors)}"
+        return None, f"validation errors: {', '.join(errors)}"
 
-    return True, None
+    return global_module, None
 
 
 def _build_update_context(
-    inst: Installation, registry: InstallationRegistry
-) -> UpdateContext | None:
-    """
-    Build the context needed for updating an installation.
-
-    Returns None if the installation cannot be updated.
-    """
-    global_module_path = MODULES_DIR / inst.module_name
-    global_module = Module.from_path(global_module_path)
-    if not global_module:
-        return None
-
-    local_modules = get_local_modules_path(inst.project_path)
+    inst: Installation,
+    registry: InstallationRegistry,
+    global_module: Module,
+    source_module: Path,
+) -> UpdateContext:
+    """Build the context needed for updating an installation."""
     target = get_target(inst.assistant)
 
-    # Refresh the local copy from global module
-    source_module = copy_module_to_local(global_module, local_modules)
-
     # Compute current skills (unprefixed), commands, agents, and mcps from the module
     current_skills = set(global_module.skills)
     current_commands = set(global_module.commands)
@@ -248,13 +247,14 @@ def _remove_orphaned_skills(ctx: UpdateContext, skill_dest: Path, verbose: bool)
     return removed
 
 
-def _remove_orphaned_commands(ctx: UpdateContext, verbose: bool) -> int:
+def _remove_orphaned_commands(
+    ctx: UpdateContext, command_dest: Path, verbose: bool
+) -> int:
     """Remove orphaned command files. Returns count of removed items."""
     if not ctx.orphaned_commands:
         return 0
 
     removed = 0
-    command_dest = ctx.target.get_command_path(ctx.inst.project_path or "")
     for cmd_name in ctx.orphaned_commands:
         if ctx.target.remove_command(command_dest, cmd_name, ctx.inst.module_name):
             removed += 1
@@ -265,13 +265,11 @@ def _remove_orphaned_commands(ctx: UpdateContext, verbose: bool) -> int:
     return removed
 
 
-def _remove_orphaned_agents(ctx: UpdateContext, verbose: bool) -> int:
+def _remove_orphaned_agents(
+    ctx: UpdateContext, agent_dest: Path | None, verbose: bool
+) -> int:
     """Remove orphaned agent files. Returns count of removed items."""
-    if not ctx.orphaned_agents:
-        return 0
-
-    agent_dest = ctx.target.get_agent_path(ctx.inst.project_path or "")
-    if not agent_dest:
+    if not ctx.orphaned_agents or not agent_dest:
         return 0
 
     removed = 0
@@ -285,13 +283,11 @@ def _remove_orphaned_agents(ctx: UpdateContext, verbose: bool) -> int:
     return removed
 
 
-def _remove_orphaned_mcps(ctx: UpdateContext, verbose: bool) -> int:
+def _remove_orphaned_mcps(
+    ctx: UpdateContext, mcp_dest: Path | None, verbose: bool
+) -> int:
     """Remove orphaned MCP servers. Returns count of removed items."""
-    if not ctx.orphaned_mcps:
-        return 0
-
-    mcp_dest = ctx.target.get_mcp_path(ctx.inst.project_path or "")
-    if not mcp_dest:
+    if not ctx.orphaned_mcps or not mcp_dest:
         return 0
 
     # For MCPs, we need to remove individual servers from the config file
@@ -307,12 +303,14 @@ def _remove_orphaned_mcps(ctx: UpdateContext, verbose: bool) -> int:
     return 0
 
 
-def _skill_owned_by_other_module(ctx: UpdateContext, skill_name: str) -> str | None:
+def _skills_owned_by_other_modules(ctx: UpdateContext) -> dict[str, str]:
     """
-    Check if a skill name is owned by another module.
+    Map skill names installed by other modules to their owning module.
 
-    Returns the owning module name if found, None otherwise.
+    Only installations for the same project path and assistant are
+    considered. The first registered owner wins.
     """
+    owners: dict[str, str] = {}
     for inst in ctx.registry.all():
         # Skip our own module
         if inst.module_name == ctx.inst.module_name:
@@ -322,10 +320,9 @@ def _skill_owned_by_other_module(ctx: UpdateContext, skill_name: str) -> str | N
             continue
         if inst.assistant != ctx.inst.assistant:
             continue
-        # Check if this module has the skill installed
-        if skill_name in inst.skills:
-            return inst.module_name
-    return None
+        for skill_name in inst.skills:
+            owners.setdefault(skill_name, inst.module_name)
+    return owners
 
 
 def _update_skills(
@@ -348,7 +345,9 @@ def _update_skills(
         for skill in ctx.global_module.skills:
             source = _skill_source_dir(ctx.source_module, skill)
             if source.exists():
-                description = _get_skill_description(source)
+                description = ctx.global_module.skill_descriptions.get(skill)
+                if description is None:
+                    description = _get_skill_description(source)
                 batch_skills.append((skill, description, source))
                 ctx.installed_skills.add(skill)
                 skills_ok += 1
@@ -368,15 +367,17 @@ def _update_skills(
                 ctx.inst.project_path,
             )
     else:
+        owners = _skills_owned_by_other_modules(ctx)
+        prefix = f"{ctx.inst.module_name}_"
         for skill in ctx.global_module.skills:
             source = _skill_source_dir(ctx.source_module, skill)
 
             # Check if another module owns this skill name
             skill_name = skill
-            owner = _skill_owned_by_other_module(ctx, skill)
+            owner = owners.get(skill)
             if owner:
                 # Use prefixed name to avoid conflict
-                skill_name = f"{ctx.inst.module_name}_{skill}"
+                skill_name = prefix + skill
                 if verbose:
                     console.print(
                         f"      [yellow]{skill}[/yellow] [dim](using {skill_name}, "
@@ -402,7 +403,9 @@ def _update_skills(
     return skills_ok, skills_failed
 
 
-def _update_commands(ctx: UpdateContext, verbose: bool) -> tuple[int, int]:
+def _update_commands(
+    ctx: UpdateContext, command_dest: Path, verbose: bool
+) -> tuple[int, int]:
     """
     Update commands for an installation.
 
@@ -414,7 +417,6 @@ def _update_commands(ctx: UpdateContext, verbose: bool) -> tuple[int, int]:
     commands_ok = 0
     commands_failed = 0
 
-    command_dest = ctx.target.get_command_path(ctx.inst.project_path or "")
     content_path = _get_content_path(ctx.source_module)
     commands_dir = content_path / "commands"
 
@@ -440,7 +442,9 @@ def _update_commands(ctx: UpdateContext, verbose: bool) -> tuple[int, int]:
     return commands_ok, commands_failed
 
 
-def _update_agents(ctx: UpdateContext, verbose: bool) -> tuple[int, int]:
+def _update_agents(
+    ctx: UpdateContext, agent_dest: Path | None, verbose: bool
+) -> tuple[int, int]:
     """
     Update agents for an installation.
 
@@ -448,8 +452,6 @@ def _update_agents(ctx: UpdateContext, verbose: bool) -> tuple[int, int]:
     """
     if not ctx.global_module.agents or not ctx.target.supports_agents:
         return 0, 0
-
-    agent_dest = ctx.target.get_agent_path(ctx.inst.project_path or "")
     if not agent_dest:
         return 0, 0
 
@@ -515,7 +517,9 @@ def _update_instructions(ctx: UpdateContext, verbose: bool) -> bool:
     return success
 
 
-def _update_mcps(ctx: UpdateContext, verbose: bool) -> tuple[int, int]:
+def _update_mcps(
+    ctx: UpdateContext, mcp_dest: Path | None, verbose: bool
+) -> tuple[int, int]:
     """
     Update MCPs for an installation.
 
@@ -524,11 +528,7 @@ def _update_mcps(ctx: UpdateContext, verbose: bool) -> tuple[int, int]:
     import json
     from lola.config import MCPS_FILE
 
-    if not ctx.global_module.mcps or not ctx.inst.project_path:
-        return 0, 0
-
-    mcp_dest = ctx.target.get_mcp_path(ctx.inst.project_path)
-    if not mcp_dest:
+    if not ctx.global_module.mcps or not ctx.inst.project_path or not mcp_dest:
         return 0, 0
 
     # Load mcps.json from source module (respecting module/ subdirectory)
@@ -562,25 +562,33 @@ def _process_single_installation(ctx: UpdateContext, verbose: bool) -> UpdateRes
     Removes orphaned items and regenerates all skills, commands, agents, MCPs, and instructions.
     """
     result = UpdateResult()
-    skill_dest = ctx.target.get_skill_path(ctx.inst.project_path or "")
+
+    # Resolve destinations once; orphan removal and regeneration share them
+    project_path = ctx.inst.project_path or ""
+    skill_dest = ctx.target.get_skill_path(project_path)
+    command_dest = ctx.target.get_command_path(project_path)
+    agent_dest = ctx.target.get_agent_path(project_path)
+    mcp_dest = ctx.target.get_mcp_path(project_path)
 
     # Remove orphaned items
     result.orphans_removed += _remove_orphaned_skills(ctx, skill_dest, verbose)
-    result.orphans_removed += _remove_orphaned_commands(ctx, verbose)
-    result.orphans_removed += _remove_orphaned_agents(ctx, verbose)
-    result.orphans_removed += _remove_orphaned_mcps(ctx, verbose)
+    result.orphans_removed += _remove_orphaned_commands(ctx, command_dest, verbose)
+    result.orphans_removed += _remove_orphaned_agents(ctx, agent_dest, verbose)
+    result.orphans_removed += _remove_orphaned_mcps(ctx, mcp_dest, verbose)
 
     # Update skills
     result.skills_ok, result.skills_failed = _update_skills(ctx, skill_dest, verbose)
 
     # Update commands
-    result.commands_ok, result.commands_failed = _update_commands(ctx, verbose)
+    result.commands_ok, result.commands_failed = _update_commands(
+        ctx, command_dest, verbose
+    )
 
     # Update agents
-    result.agents_ok, result.agents_failed = _update_agents(ctx, verbose)
+    result.agents_ok, result.agents_failed = _update_agents(ctx, agent_dest, verbose)
 
     # Update MCPs
-    result.mcps_ok, result.mcps_failed = _update_mcps(ctx, verbose)
+    result.mcps_ok, result.mcps_failed = _update_mcps(ctx, mcp_dest, verbose)
 
     # Update instructions
     result.instructions_ok = _update_instructions(ctx, verbose)
@@ -635,7 +643,7 @@ def _format_update_summary(result: UpdateResult) -> str:
 @click.option(
     "-a",
     "--assistant",
-    type=click.Choice(list(TARGETS.keys())),
+    type=click.Choice(ASSISTANT_NAMES),
     default=None,
     help="AI assistant to install skills for (default: all)",
 )
@@ -675,9 +683,12 @@ def install_cmd(
 
     # Validate project path
     scope = "project"
-    project_path = str(Path(project_path).resolve())
-    if not Path(project_path).exists():
-        _handle_lola_error(PathNotFoundError(project_path, "Project path"))
+    try:
+        project_path = str(Path(project_path).resolve(strict=True))
+    except OSError:
+        _handle_lola_error(
+            PathNotFoundError(Path(project_path).resolve(), "Project path")
+        )
 
     # Default to global registry
     module_path = MODULES_DIR / module_name
@@ -741,16 +752,55 @@ def install_cmd(
     registry = get_registry()
 
     # Determine which assistants to install to
-    assistants_to_install = [assistant] if assistant else list(TARGETS.keys())
+    assistants_to_install = [assistant] if assistant else list(ASSISTANT_NAMES)
 
     console.print(f"\n[bold]Installing {module_name} -> {project_path}[/bold]")
     console.print()
 
     total_installed = 0
-    for asst in assistants_to_install:
-        total_installed += install_to_assistant(
-            module, asst, scope, project_path, local_modules, registry, verbose, force
-        )
+    with registry.transaction():
+        if force and len(assistants_to_install) > 1:
+            # Without prompts, each assistant writes to its own files and can be
+            # installed concurrently from a single local copy of the module.
+            # Summaries and registry entries are drained here in assistant
+            # order so output and installed.yml don't depend on thread timing.
+            from concurrent.futures import ThreadPoolExecutor
+
+            local_module_path = copy_module_to_local(module, local_modules)
+            with ThreadPoolExecutor(max_workers=len(assistants_to_install)) as pool:
+                futures = [
+                    pool.submit(
+                        _install_assistant_files,
+                        module,
+                        asst,
+                        scope,
+                        project_path,
+                        local_modules,
+                        verbose,
+                        force,
+                        local_module_path,
+                    )
+                    for asst in assistants_to_install
+                ]
+                for future in futures:
+                    count, summary, installation = future.result()
+                    if summary:
+                        console.print(summary)
+                    if installation:
+                        registry.add(installation)
+                    total_installed += count
+        else:
+            for asst in assistants_to_install:
+                total_installed += install_to_assistant(
+                    module,
+                    asst,
+                    scope,
+                    project_path,
+                    local_modules,
+                    registry,
+                    verbose,
+                    force,
+                )
 
     console.print()
     console.print(
@@ -763,7 +813,7 @@ def install_cmd(
 @click.option(
     "-a",
     "--assistant",
-    type=click.Choice(list(TARGETS.keys())),
+    type=click.Choice(ASSISTANT_NAMES),
     default=None,
     help="AI assistant to uninstall from (optional)",
 )
@@ -818,12 +868,9 @@ def uninstall_cmd(
     console.print()
 
     # Group installations by project for cleaner display
-    by_project = {}
+    by_project: defaultdict[str, list[Installation]] = defaultdict(list)
     for inst in installations:
-        key = inst.project_path or "~/.lola (user scope)"
-        if key not in by_project:
-            by_project[key] = []
-        by_project[key].append(inst)
+        by_project[inst.project_path or "~/.lola (user scope)"].append(inst)
 
     for project, insts in by_project.items():
         assistants = [i.assistant for i in insts]
@@ -864,112 +911,117 @@ def uninstall_cmd(
 
     # Uninstall each
     removed_count = 0
-    for inst in installations:
-        # Skip installations without project_path (legacy user-scope entries)
-        if not inst.project_path:
-            console.print(
-                f"  [yellow]Skipping {inst.assistant}: no project path (legacy entry)[/yellow]"
-            )
-            # Still remove from registry to clean up
-            registry.remove(
-                module_name,
-                assistant=inst.assistant,
-                scope=inst.scope,
-                project_path=inst.project_path,
-            )
-            continue
+    with registry.transaction():
+        for inst in installations:
+            # Skip installations without project_path (legacy user-scope entries)
+            if not inst.project_path:
+                console.print(
+                    f"  [yellow]Skipping {inst.assistant}: no project path (legacy entry)[/yellow]"
+                )
+                # Still remove from registry to clean up
+                registry.remove(
+                    module_name,
+                    assistant=inst.assistant,
+                    scope=inst.scope,
+                    project_path=inst.project_path,
+                )
+                continue
 
-        target = get_target(inst.assistant)
+            target = get_target(inst.assistant)
 
-        # Remove skill files
-        if inst.skills:
-            skill_dest = target.get_skill_path(inst.project_path)
+            # Remove skill files
+            if inst.skills:
+                skill_dest = target.get_skill_path(inst.project_path)
 
-            if target.uses_managed_section:
-                # Managed section targets: remove module section from GEMINI.md/AGENTS.md
-                if target.remove_skill(skill_dest, module_name):
+                if target.uses_managed_section:
+                    # Managed section targets: remove module section from GEMINI.md/AGENTS.md
+                    if target.remove_skill(skill_dest, module_name):
+                        removed_count += 1
+                        if verbose:
+                            console.print(
+                                f"  [green]Removed skills from {skill_dest}[/green]"
+                            )
+                else:
+                    for skill in inst.skills:
+                        if target.remove_skill(skill_dest, skill):
+                            removed_count += 1
+                            if verbose:
+                                console.print(f"  [green]Removed {skill}[/green]")
+
+            # Remove command files
+            if inst.commands:
+                command_dest = target.get_command_path(inst.project_path)
+
+                for cmd_name in inst.commands:
+                    if target.remove_command(command_dest, cmd_name, module_name):
+                        removed_count += 1
+                        if verbose:
+                            filename = target.get_command_filename(
+                                module_name, cmd_name
+                            )
+                            console.print(
+                                f"  [green]Removed {command_dest / filename}[/green]"
+                            )
+
+            # Remove agent files
+            if inst.agents:
+                agent_dest = target.get_agent_path(inst.project_path)
+
+                if agent_dest:
+                    for agent_name in inst.agents:
+                        if target.remove_agent(agent_dest, agent_name, module_name):
+                            removed_count += 1
+                            if verbose:
+                                filename = target.get_agent_filename(
+                                    module_name, agent_name
+                                )
+                                console.print(
+                                    f"  [green]Removed {agent_dest / filename}[/green]"
+                                )
+
+            # Remove instructions
+            if inst.has_instructions:
+                instructions_dest = target.get_instructions_path(inst.project_path)
+                if target.remove_instructions(instructions_dest, module_name):
                     removed_count += 1
                     if verbose:
                         console.print(
-                            f"  [green]Removed skills from {skill_dest}[/green]"
+                            f"  [green]Removed instructions from {instructions_dest}[/green]"
                         )
-            else:
-                for skill in inst.skills:
-                    if target.remove_skill(skill_dest, skill):
-                        removed_count += 1
-                        if verbose:
-                            console.print(f"  [green]Removed {skill}[/green]")
 
-        # Remove command files
-        if inst.commands:
-            command_dest = target.get_command_path(inst.project_path)
-
-            for cmd_name in inst.commands:
-                if target.remove_command(command_dest, cmd_name, module_name):
+            # Remove MCP servers
+            if inst.mcps:
+                mcp_dest = target.get_mcp_path(inst.project_path)
+                if mcp_dest and target.remove_mcps(mcp_dest, module_name):
+                    removed_count += len(inst.mcps)
+                    if verbose:
+                        console.print(f"  [green]Removed MCPs from {mcp_dest}[/green]")
+
+            # Also remove the project-local module copy
+            if inst.scope == "project":
+                local_modules = get_local_modules_path(inst.project_path)
+                source_module = local_modules / module_name
+                if source_module.is_symlink():
+                    source_module.unlink()
                     removed_count += 1
                     if verbose:
-                        filename = target.get_command_filename(module_name, cmd_name)
                         console.print(
-                            f"  [green]Removed {command_dest / filename}[/green]"
+                            f"  [green]Removed symlink {source_module}[/green]"
                         )
+                elif source_module.exists():
+                    # Handle legacy copies
+                    shutil.rmtree(source_module)
+                    removed_count += 1
+                    if verbose:
+                        console.print(f"  [green]Removed {source_module}[/green]")
 
-        # Remove agent files
-        if inst.agents:
-            agent_dest = target.get_agent_path(inst.project_path)
-
-            if agent_dest:
-                for agent_name in inst.agents:
-                    if target.remove_agent(agent_dest, agent_name, module_name):
-                        removed_count += 1
-                        if verbose:
-                            filename = target.get_agent_filename(
-                                module_name, agent_name
-                            )
-                            console.print(
-                                f"  [green]Removed {agent_dest / filename}[/green]"
-                            )
-
-        # Remove instructions
-        if inst.has_instructions:
-            instructions_dest = target.get_instructions_path(inst.project_path)
-            if target.remove_instructions(instructions_dest, module_name):
-                removed_count += 1
-                if verbose:
-                    console.print(
-                        f"  [green]Removed instructions from {instructions_dest}[/green]"
-                    )
-
-        # Remove MCP servers
-        if inst.mcps:
-            mcp_dest = target.get_mcp_path(inst.project_path)
-            if mcp_dest and target.remove_mcps(mcp_dest, module_name):
-                removed_count += len(inst.mcps)
-                if verbose:
-                    console.print(f"  [green]Removed MCPs from {mcp_dest}[/green]")
-
-        # Also remove the project-local module copy
-        if inst.scope == "project":
-            local_modules = get_local_modules_path(inst.project_path)
-            source_module = local_modules / module_name
-            if source_module.is_symlink():
-                source_module.unlink()
-                removed_count += 1
-                if verbose:
-                    console.print(f"  [green]Removed symlink {source_module}[/green]")
-            elif source_module.exists():
-                # Handle legacy copies
-                shutil.rmtree(source_module)
-                removed_count += 1
-                if verbose:
-                    console.print(f"  [green]Removed {source_module}[/green]")
-
-        # Remove from registry
-        registry.remove(
-            module_name,
-            assistant=inst.assistant,
-            scope=inst.scope,
-            project_path=inst.project_path,
-        )
+            # Remove from registry
+            registry.remove(
+                module_name,
+                assistant=inst.assistant,
+                scope=inst.scope,
+                project_path=inst.project_path,
+            )
 
     console.print(
         f"[green]Uninstalled from {len(installations)} installation{'s' if len(installations) != 1 else ''}[/green]"
@@ -981,7 +1033,7 @@ def uninstall_cmd(
 @click.option(
     "-a",
     "--assistant",
-    type=click.Choice(list(TARGETS.keys())),
+    type=click.Choice(ASSISTANT_NAMES),
     default=None,
     help="Filter by AI assistant",
 )
@@ -1020,10 +1072,8 @@ def update_cmd(module_name: Optional[str], assistant: Optional[str], verbose: bo
         return
 
     # Group installations by module name for cleaner display
-    by_module: dict[str, list[Installation]] = {}
+    by_module: defaultdict[str, list[Installation]] = defaultdict(list)
     for inst in installations:
-        if inst.module_name not in by_module:
-            by_module[inst.module_name] = []
         by_module[inst.module_name].append(inst)
 
     module_word = "module" if len(by_module) == 1 else "modules"
@@ -1032,55 +1082,59 @@ def update_cmd(module_name: Optional[str], assistant: Optional[str], verbose: bo
 
     stale_installations: list[Installation] = []
 
-    for mod_name, mod_installations in by_module.items():
-        console.print(f"[bold]{mod_name}[/bold]")
-
-        # Group by (scope, path) for display
-        by_scope_path: dict[tuple[str, str | None], list[Installation]] = {}
-        for inst in mod_installations:
-            key = (inst.scope, inst.project_path)
-            if key not in by_scope_path:
-                by_scope_path[key] = []
-            by_scope_path[key].append(inst)
+    with registry.transaction():
+        for mod_name, mod_installations in by_module.items():
+            console.print(f"[bold]{mod_name}[/bold]")
 
-        for (scope, project_path), scope_insts in by_scope_path.items():
-            console.print(f"  [dim]scope:[/dim] {scope}")
-            if project_path:
-                console.print(f'  [dim]path:[/dim] "{project_path}"')
-
-            for inst in scope_insts:
-                # Validate installation
-                is_valid, error_msg = _validate_installation_for_update(inst)
-                if not is_valid:
-                    console.print(f"    [red]{inst.assistant}: {error_msg}[/red]")
-                    if error_msg == "project path no longer exists":
-                        stale_installations.append(inst)
+            # Group by (scope, path) for display
+            by_scope_path: defaultdict[tuple[str, str | None], list[Installation]] = (
+                defaultdict(list)
+            )
+            for inst in mod_installations:
+                by_scope_path[(inst.scope, inst.project_path)].append(inst)
+
+            for (scope, project_path), scope_insts in by_scope_path.items():
+                console.print(f"  [dim]scope:[/dim] {scope}")
+                if project_path:
+                    console.print(f'  [dim]path:[/dim] "{project_path}"')
+
+                # Validate once per group: every assistant here shares the
+                # same module and project path
+                global_module, error_msg = _load_update_source(scope_insts[0])
+                if global_module is None:
+                    for inst in scope_insts:
+                        console.print(f"    [red]{inst.assistant}: {error_msg}[/red]")
+                        if error_msg == "project path no longer exists":
+                            stale_installations.append(inst)
                     continue
 
-                # Build context for update
-                ctx = _build_update_context(inst, registry)
-                if not ctx:
-                    console.print(
-                        f"    [red]{inst.assistant}: failed to build context[/red]"
+                # Refresh the local copy from the global module once for the group
+                source_module = copy_module_to_local(
+                    global_module, get_local_modules_path(project_path)
+                )
+
+                for inst in scope_insts:
+                    # Build context for update
+                    ctx = _build_update_context(
+                        inst, registry, global_module, source_module
                     )
-                    continue
 
-                # Process the installation update
-                result = _process_single_installation(ctx, verbose)
+                    # Process the installation update
+                    result = _process_single_installation(ctx, verbose)
 
-                # Update the registry with actual installed skills (may include prefixed names)
-                inst.skills = list(ctx.installed_skills)
-                inst.commands = list(ctx.current_commands)
-                inst.agents = list(ctx.current_agents)
-                inst.mcps = list(ctx.current_mcps)
-                inst.has_instructions = result.instructions_ok
-                registry.add(inst)
+                    # Update the registry with actual installed skills (may include prefixed names)
+                    inst.skills = list(ctx.installed_skills)
+                    inst.commands = list(ctx.current_commands)
+                    inst.agents = list(ctx.current_agents)
+                    inst.mcps = list(ctx.current_mcps)
+                    inst.has_instructions = result.instructions_ok
+                    registry.add(inst)
 
-                # Print summary line for this installation
-                summary = _format_update_summary(result)
-                console.print(
-                    f"    [green]{inst.assistant}[/green] [dim]{summary}[/dim]"
-                )
+                    # Print summary line for this installation
+                    summary = _format_update_summary(result)
+                    console.print(
+                        f"    [green]{inst.assistant}[/green] [dim]{summary}[/dim]"
+                    )
 
     console.print()
     if stale_installations:
@@ -1094,7 +1148,7 @@ def update_cmd(module_name: Optional[str], assistant: Optional[str], verbose: bo
 @click.option(
     "-a",
     "--assistant",
-    type=click.Choice(list(TARGETS.keys())),
+    type=click.Choice(ASSISTANT_NAMES),
     default=None,
     help="Filter by AI assistant",
 )
@@ -1119,10 +1173,8 @@ def list_installed_cmd(assistant: Optional[str]):
         return
 
     # Group by module name
-    by_module = {}
+    by_module: defaultdict[str, list[Installation]] = defaultdict(list)
     for inst in installations:
-        if inst.module_name not in by_module:
-            by_module[inst.module_name] = []
         by_module[inst.module_name].append(inst)
 
     # Pluralize correctly
@@ -1134,12 +1186,11 @@ def list_installed_cmd(assistant: Optional[str]):
         console.print(f"[bold]{mod_name}[/bold]")
 
         # Group installations by (scope, path) to consolidate assistants
-        by_scope_path = {}
+        by_scope_path: defaultdict[tuple[str, str | None], list[Installation]] = (
+            defaultdict(list)
+        )
         for inst in insts:
-            key = (inst.scope, inst.project_path)
-            if key not in by_scope_path:
-                by_scope_path[key] = []
-            by_scope_path[key].append(inst)
+            by_scope_path[(inst.scope, inst.project_path)].append(inst)
 
         for (scope, project_path), scope_insts in by_scope_path.items():
             # Collect all assistants for this scope/path
@@ -106,28 +106,43 @@ def validate_skill(skill_file: Path) -> list[str]:
     Returns:
         List of warning/error messages (empty if valid)
     """
+    _, errors = load_skill(skill_file)
+    return errors
+
+
+def load_skill(skill_file: Path) -> tuple[dict, list[str]]:
+    """
+    Read a SKILL.md file once, returning its frontmatter and validation errors.
+
+    Args:
+        skill_file: Path to the SKILL.md file
+
+    Returns:
+        Tuple of (frontmatter dict, list of warning/error messages). The
+        frontmatter dict is empty if the file could not be parsed.
+    """
     errors = []
 
     try:
         content = skill_file.read_text()
     except Exception as e:
-        return [f"Cannot read file: {e}"]
+        return {}, [f"Cannot read file: {e}"]
 
     if not content.startswith("---"):
         errors.append("Missing YAML frontmatter (required)")
-        return errors
+        return {}, errors
 
     try:
         post = frontmatter.loads(content)
-        metadata = post.metadata
+        metadata = dict(post.metadata)
     except Exception as e:
         errors.append(f"Error: Invalid YAML frontmatter - {e}")
-        return errors
+        return {}, errors
 
     if not metadata.get("description"):
         errors.append("Missing required 'description' field in frontmatter")
 
-    return errors
+    return metadata, errors
 
 
 def validate_agent(agent_file: Path) -> list[str]:
@@ -6,7 +6,6 @@ main:
 import click
 from rich.console import Console
 
-from lola import __version__
 from lola.cli.install import (
     install_cmd,
     list_installed_cmd,
@@ -21,6 +20,8 @@ console = Console()
 
 def ver():
     """Show version."""
+    from lola import __version__
+
     console.print(f"lola {__version__}")
 
 
@@ -5,14 +5,19 @@ market.manager:
 """
 
 from pathlib import Path
+import re
 from rich.console import Console
 from rich.table import Table
 import yaml
 
 from lola.models import Marketplace
-from lola.market.search import search_market, display_market
+from lola.market.search import display_market, parsed_sidecar_path, search_market
 from lola.exceptions import MarketplaceNameError
 
+# Names that pass every check in validate_marketplace_name: non-empty, no
+# leading dot, no path separators
+_VALID_MARKETPLACE_NAME = re.compile(r"[^./\\][^/\\]*")
+
 
 def parse_market_ref(module_name: str) -> tuple[str, str] | None:
     """
@@ -40,6 +45,9 @@ def validate_marketplace_name(name: str) -> str:
     Returns:
         The validated name.
     """
+    if _VALID_MARKETPLACE_NAME.fullmatch(name):
+        return name
+
     if not name:
         raise MarketplaceNameError(name, "name cannot be empty")
     if name in (".", ".."):
@@ -303,6 +311,7 @@ class MarketplaceRegistry:
         ref_file.unlink()
         if cache_file.exists():
             cache_file.unlink()
+        parsed_sidecar_path(cache_file).unlink(missing_ok=True)
 
         self.console.print(f"[green]Removed marketplace '{name}'[/green]")
 
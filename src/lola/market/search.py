@@ -3,12 +3,225 @@ market.search:
     Module search functionality across marketplaces
 """
 
+from collections.abc import Callable, Iterator
+import json
+import os
 from pathlib import Path
+import re
 from rich.console import Console
 from rich.table import Table
 import yaml
 
-from lola.models import Marketplace
+from lola.models import Marketplace, _YamlDumper
+
+# Parsed marketplace files shared across calls within one process. Each entry
+# maps a path to the (mtime, size) it was parsed at and the parsed result, so
+# an edited or re-downloaded file is parsed again.
+_REF_CACHE: dict[str, tuple[tuple[int, int], Marketplace]] = {}
+_CACHE_CACHE: dict[str, tuple[tuple[int, int], Marketplace]] = {}
+
+# Bump when the layout of the parsed-cache sidecar, or what lola derives from
+# its contents, changes; sidecars written with another version are rebuilt
+_SIDECAR_SCHEMA = 1
+
+# Above this many results, search output skips the Rich table, whose layout
+# cost grows with every cell, and writes plain tab-separated rows
+_PLAIN_ROWS_THRESHOLD = 500
+
+# Reference files are flat mappings written by yaml.dump, so a disabled one
+# carries this exact top-level line
+_DISABLED_REF = re.compile(rb"^enabled:[ \t]*false[ \t]*$", re.MULTILINE)
+
+
+def _load_marketplace(
+    path: Path,
+    loader: Callable[[Path], Marketplace],
+    cache: dict[str, tuple[tuple[int, int], Marketplace]],
+) -> Marketplace:
+    """Load a marketplace file, reusing the parsed result while it is unchanged."""
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = str(path)
+    cached = cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    marketplace = loader(path)
+    cache[key] = (stamp, marketplace)
+    return marketplace
+
+
+def parsed_sidecar_path(cache_file: Path) -> Path:
+    """Return the JSON sidecar holding the parsed form of a cache file."""
+    return cache_file.with_suffix(".parsed.json")
+
+
+def _read_sidecar(sidecar: Path, stamp: tuple[int, int]) -> Marketplace | None:
+    """Read a parsed marketplace from its sidecar if it matches the YAML stamp."""
+    try:
+        with open(sidecar, "rb") as f:
+            payload = json.load(f)
+    except OSError:
+        return None
+    except ValueError:
+        # Truncated or otherwise unreadable: rebuild it
+        return None
+    if (
+        not isinstance(payload, dict)
+        or payload.get("schema") != _SIDECAR_SCHEMA
+        or payload.get("stamp") != list(stamp)
+    ):
+        return None
+    data = payload.get("marketplace")
+    if not isinstance(data, dict) or not isinstance(data.get("modules"), list):
+        return None
+    return Marketplace(
+        name=data.get("name", ""),
+        url=data.get("url", ""),
+        enabled=data.get("enabled", True),
+        description=data.get("description", ""),
+        version=data.get("version", ""),
+        modules=data["modules"],
+    )
+
+
+def _write_sidecar(
+    sidecar: Path, stamp: tuple[int, int], marketplace: Marketplace
+) -> None:
+    """Write the parsed marketplace next to its cache file, ignoring failures."""
+    payload = {
+        "schema": _SIDECAR_SCHEMA,
+        "stamp": list(stamp),
+        "marketplace": {
+            "name": marketplace.name,
+            "url": marketplace.url,
+            "enabled": marketplace.enabled,
+            "description": marketplace.description,
+            "version": marketplace.version,
+            "modules": marketplace.modules,
+        },
+    }
+    tmp = sidecar.with_name(sidecar.name + ".tmp")
+    try:
+        with open(tmp, "w") as f:
+            json.dump(payload, f, separators=(",", ":"))
+        os.replace(tmp, sidecar)
+    except (OSError, TypeError, ValueError):
+        # TypeError/ValueError: YAML values JSON cannot hold, such as dates
+        tmp.unlink(missing_ok=True)
+
+
+def _load_cache_file(cache_file: Path) -> Marketplace:
+    """
+    Load a marketplace cache file and precompute its modules' search text.
+
+    The YAML file stays the source of truth. Its parsed fields are kept as
+    plain JSON in a sidecar, stamped with the YAML's (mtime, size) and the
+    sidecar schema version, so later processes skip the YAML parse until the
+    cache file changes or lola changes what it stores.
+    """
+    st = cache_file.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    sidecar = parsed_sidecar_path(cache_file)
+
+    marketplace = _read_sidecar(sidecar, stamp)
+    if marketplace is None:
+        marketplace = Marketplace.from_cache(cache_file)
+        _write_sidecar(sidecar, stamp, marketplace)
+    for module in marketplace.modules:
+        _search_blob(module)
+        _short_description(module)
+    return marketplace
+
+
+def _load_reference_file(ref_file: Path) -> Marketplace:
+    """
+    Load a marketplace reference file, skipping the YAML parse when disabled.
+
+    A disabled reference yields a placeholder with only its name and
+    enabled=False, which is all callers look at before skipping it. Anything
+    the byte check does not recognise is parsed normally.
+    """
+    with open(ref_file, "rb") as f:
+        head = f.read(4096)
+    if _DISABLED_REF.search(head):
+        return Marketplace(name=ref_file.stem, url="", enabled=False)
+    return Marketplace.from_reference(ref_file)
+
+
+def _load_enabled_marketplace(
+    marketplace_ref: Marketplace, cache_file: Path, cached: bool
+) -> Marketplace | None:
+    """
+    Load the cached catalog of an enabled marketplace.
+
+    A missing cache (``cached`` is False) is downloaded and written first.
+    Returns None if that download fails.
+    """
+    if not cached:
+        try:
+            marketplace = Marketplace.from_url(
+                marketplace_ref.url, marketplace_ref.name
+            )
+            with open(cache_file, "w") as f:
+                yaml.dump(marketplace.to_cache_dict(), f, Dumper=_YamlDumper)
+        except Exception:
+            return None
+
+    return _load_marketplace(cache_file, _load_cache_file, _CACHE_CACHE)
+
+
+def iter_enabled_marketplaces(
+    market_dir: Path, cache_dir: Path
+) -> Iterator[tuple[Marketplace, str]]:
+    """
+    Yield enabled marketplaces with their cached data, one at a time.
+
+    With several enabled marketplaces their caches are loaded (or downloaded)
+    on a small thread pool; results are still yielded in directory order.
+
+    Args:
+        market_dir: Directory containing marketplace reference files
+        cache_dir: Directory containing marketplace cache files
+
+    Yields:
+        Tuples of (Marketplace, marketplace_name)
+    """
+    try:
+        with os.scandir(market_dir) as it:
+            ref_names = [e.name for e in it if e.name.endswith(".yml") and e.is_file()]
+    except FileNotFoundError:
+        return
+
+    # One directory listing instead of an exists() call per marketplace
+    try:
+        cache_names = set(os.listdir(cache_dir))
+    except FileNotFoundError:
+        cache_names = set()
+
+    enabled: list[tuple[Marketplace, Path, bool]] = []
+    for ref_name in ref_names:
+        marketplace_ref = _load_marketplace(
+            market_dir / ref_name, _load_reference_file, _REF_CACHE
+        )
+        if marketplace_ref.enabled:
+            enabled.append(
+                (marketplace_ref, cache_dir / ref_name, ref_name in cache_names)
+            )
+
+    if len(enabled) <= 1:
+        for marketplace_ref, cache_file, cached in enabled:
+            marketplace = _load_enabled_marketplace(marketplace_ref, cache_file, cached)
+            if marketplace is not None:
+                yield marketplace, marketplace_ref.name
+        return
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(8, len(enabled))) as executor:
+        loaded = executor.map(lambda e: _load_enabled_marketplace(*e), enabled)
+        for (marketplace_ref, *_), marketplace in zip(enabled, loaded):
+            if marketplace is not None:
+                yield marketplace, marketplace_ref.name
 
 
 def get_enabled_marketplaces(market_dir: Path, cache_dir: Path):
@@ -22,29 +235,40 @@ def get_enabled_marketplaces(market_dir: Path, cache_dir: Path):
     Returns:
         List of tuples (Marketplace, marketplace_name)
     """
-    marketplaces = []
+    return list(iter_enabled_marketplaces(market_dir, cache_dir))
 
-    for ref_file in market_dir.glob("*.yml"):
-        marketplace_ref = Marketplace.from_reference(ref_file)
 
-        if not marketplace_ref.enabled:
-            continue
+def _search_blob(module: dict) -> str:
+    """
+    Return the lowercased searchable text of a module.
 
-        cache_file = cache_dir / ref_file.name
-        if not cache_file.exists():
-            try:
-                marketplace = Marketplace.from_url(
-                    marketplace_ref.url, marketplace_ref.name
-                )
-                with open(cache_file, "w") as f:
-                    yaml.dump(marketplace.to_cache_dict(), f)
-            except Exception:
-                continue
+    Name, description and tags are joined with NUL separators so a query
+    cannot match across two fields. The result is cached on the module dict,
+    which lives as long as its parsed marketplace.
+    """
+    blob = module.get("_search_blob")
+    if blob is None:
+        fields = [module.get("name", ""), module.get("description", "")]
+        fields.extend(module.get("tags", []))
+        blob = "\0".join(fields).lower()
+        module["_search_blob"] = blob
+    return blob
 
-        marketplace = Marketplace.from_cache(cache_file)
-        marketplaces.append((marketplace, marketplace_ref.name))
 
-    return marketplaces
+def _short_description(module: dict) -> str:
+    """
+    Return the module description truncated for result listings.
+
+    Cached on the module dict like the search blob, so it is computed when
+    the cache file is loaded rather than for every search hit.
+    """
+    short = module.get("_description_short")
+    if short is None:
+        short = module.get("description", "")
+        if len(short) > 60:
+            short = short[:60] + "..."
+        module["_description_short"] = short
+    return short
 
 
 def match_module(module: dict, query_lower: str) -> bool:
@@ -58,15 +282,9 @@ def match_module(module: dict, query_lower: str) -> bool:
     Returns:
         True if module matches query
     """
-    name = module.get("name", "").lower()
-    description = module.get("description", "").lower()
-    tags = module.get("tags", [])
-
-    return (
-        query_lower in name
-        or query_lower in description
-        or any(query_lower in tag.lower() for tag in tags)
-    )
+    if not query_lower:
+        return True
+    return query_lower in _search_blob(module)
 
 
 def format_search_result(module: dict, marketplace_name: str) -> dict:
@@ -80,14 +298,11 @@ def format_search_result(module: dict, marketplace_name: str) -> dict:
     Returns:
         Formatted result dictionary
     """
-    description = module.get("description", "")
-    if len(description) > 60:
-        description = description[:60] + "..."
-
+    get = module.get
     return {
-        "name": module.get("name", ""),
-        "description": description,
-        "version": module.get("version", ""),
+        "name": get("name", ""),
+        "description": _short_description(module),
+        "version": get("version", ""),
         "marketplace": marketplace_name,
     }
 
@@ -104,15 +319,13 @@ def search_market(query: str, market_dir: Path, cache_dir: Path) -> list[dict]:
     Returns:
         List of formatted search results
     """
-    marketplaces = get_enabled_marketplaces(market_dir, cache_dir)
     results = []
     query_lower = query.lower()
 
-    for marketplace, name in marketplaces:
+    for marketplace, name in iter_enabled_marketplaces(market_dir, cache_dir):
         for module in marketplace.modules:
             if match_module(module, query_lower):
-                result = format_search_result(module, name)
-                results.append(result)
+                results.append(format_search_result(module, name))
 
     return results
 
@@ -121,6 +334,10 @@ def display_market(results: list[dict], query: str, console: Console) -> None:
     """
     Display search results in a table.
 
+    When output is not a terminal (piped or redirected), or there are more
+    than _PLAIN_ROWS_THRESHOLD results, rows are written as tab-separated
+    text instead, which is cheaper to produce and easier to post-process.
+
     Args:
         results: List of formatted search results
         query: Original search query
@@ -131,20 +348,31 @@ def display_market(results: list[dict], query: str, console: Console) -> None:
         console.print("[dim]Tip: Check spelling or try a different search term[/dim]")
         return
 
+    count_text = "s" if len(results) != 1 else ""
+    console.print(f"\n[bold]Found {len(results)} module{count_text}[/bold]\n")
+
+    if not console.is_terminal or len(results) > _PLAIN_ROWS_THRESHOLD:
+        lines = ["Module\tVersion\tMarketplace\tDescription"]
+        lines.extend(
+            f"{r['name']}\t{r['version']}\t{r['marketplace']}\t{r['description']}"
+            for r in results
+        )
+        console.file.write("\n".join(lines) + "\n")
+        return
+
     table = Table(show_header=True, header_style="bold")
     table.add_column("Module")
     table.add_column("Version")
     table.add_column("Marketplace")
     table.add_column("Description")
 
+    add_row = table.add_row
     for result in results:
-        table.add_row(
+        add_row(
             result["name"],
             result["version"],
             result["marketplace"],
             result["description"],
         )
 
-    count_text = "s" if len(results) != 1 else ""
-    console.print(f"\n[bold]Found {len(results)} module{count_text}[/bold]\n")
     console.print(table)
@@ -3,9 +3,13 @@ models:
     Data models for lola modules, skills, and installations
 """
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 import json
+import os
 from pathlib import Path
+import threading
 from typing import Optional
 import yaml
 
@@ -16,6 +20,10 @@ from lola.exceptions import ValidationError
 SKILLS_DIRNAME = "skills"
 MODULE_CONTENT_DIRNAME = "module"
 
+# Prefer libyaml's C parser and emitter when PyYAML was built with them
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 @dataclass
 class Skill:
@@ -137,6 +145,10 @@ class Module:
     mcps: list[str] = field(default_factory=list)
     has_instructions: bool = False
     uses_module_subdir: bool = False  # True if content is in module/ subdirectory
+    # Skill descriptions read from SKILL.md during validate(), keyed by skill name
+    skill_descriptions: dict[str, str] = field(
+        default_factory=dict, repr=False, compare=False
+    )
 
     @classmethod
     def from_path(cls, module_path: Path) -> Optional["Module"]:
@@ -262,8 +274,10 @@ class Module:
             elif not (skill_path / SKILL_FILE).exists():
                 errors.append(f"Missing {SKILL_FILE} in skill: {skill_rel}")
             else:
-                # Validate SKILL.md frontmatter
-                skill_errors = fm.validate_skill(skill_path / SKILL_FILE)
+                # Validate SKILL.md frontmatter, keeping the description so
+                # installers don't need to parse the file again
+                metadata, skill_errors = fm.load_skill(skill_path / SKILL_FILE)
+                self.skill_descriptions[skill_rel] = metadata.get("description") or ""
                 for err in skill_errors:
                     errors.append(f"{skill_rel}/{SKILL_FILE}: {err}")
 
@@ -328,7 +342,7 @@ class Marketplace:
     def from_reference(cls, ref_file: Path) -> "Marketplace":
         """Load marketplace from reference file."""
         with open(ref_file) as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
         return cls(
             name=data.get("name", ""),
             url=data.get("url", ""),
@@ -339,7 +353,7 @@ class Marketplace:
     def from_cache(cls, cache_file: Path) -> "Marketplace":
         """Load marketplace from cache file."""
         with open(cache_file) as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
         return cls(
             name=data.get("name", ""),
             url=data.get("url", ""),
@@ -357,7 +371,7 @@ class Marketplace:
 
         try:
             with urlopen(url, timeout=10) as response:
-                data = yaml.safe_load(response.read())
+                data = yaml.load(response.read(), Loader=_YamlLoader)
         except URLError as e:
             raise ValueError(f"Failed to download marketplace: {e}")
 
@@ -462,20 +476,34 @@ class InstallationRegistry:
     def __init__(self, registry_path: Path):
         self.path = registry_path
         self._installations: list[Installation] = []
-        self._load()
+        self._loaded = False
+        self._transaction_depth = 0
+        self._dirty = False
+        # Guards the installation list so installs can run on worker threads
+        self._lock = threading.RLock()
+
+    def _ensure_loaded(self):
+        """Load installations from file on first access."""
+        with self._lock:
+            if not self._loaded:
+                self._load()
 
     def _load(self):
         """Load installations from file."""
         if not self.path.exists():
             self._installations = []
+            self._loaded = True
             return
 
         with open(self.path, "r") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_YamlLoader) or {}
 
         self._installations = [
             Installation.from_dict(inst) for inst in data.get("installations", [])
         ]
+        # Only mark loaded after a successful parse, so a corrupt file raises
+        # again rather than leaving an empty list a later save would persist
+        self._loaded = True
 
     def _save(self):
         """Save installations to file."""
@@ -486,24 +514,69 @@ class InstallationRegistry:
             "installations": [inst.to_dict() for inst in self._installations],
         }
 
-        with open(self.path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        # Write to a temporary file and rename it over installed.yml so an
+        # interrupted save never leaves a truncated registry behind
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        try:
+            with open(tmp_path, "w") as f:
+                yaml.dump(
+                    data,
+                    f,
+                    Dumper=_YamlDumper,
+                    default_flow_style=False,
+                    sort_keys=False,
+                )
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        self._dirty = False
+
+    def _commit(self):
+        """Save now, or mark dirty if a transaction is open."""
+        if self._transaction_depth:
+            self._dirty = True
+        else:
+            self._save()
+
+    @contextmanager
+    def transaction(self) -> Iterator["InstallationRegistry"]:
+        """
+        Batch registry changes into a single write.
+
+        add() and remove() only update the in-memory list while the
+        transaction is open; the file is written once when the outermost
+        transaction exits, including when it exits with an exception.
+        """
+        with self._lock:
+            self._transaction_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._transaction_depth -= 1
+                if self._transaction_depth == 0 and self._dirty:
+                    self._save()
 
     def add(self, installation: Installation):
         """Add an installation record."""
-        # Remove any existing installation with same key
-        self._installations = [
-            inst
-            for inst in self._installations
-            if not (
-                inst.module_name == installation.module_name
-                and inst.assistant == installation.assistant
-                and inst.scope == installation.scope
-                and inst.project_path == installation.project_path
-            )
-        ]
-        self._installations.append(installation)
-        self._save()
+        self._ensure_loaded()
+        with self._lock:
+            # Remove any existing installation with same key
+            self._installations = [
+                inst
+                for inst in self._installations
+                if not (
+                    inst.module_name == installation.module_name
+                    and inst.assistant == installation.assistant
+                    and inst.scope == installation.scope
+                    and inst.project_path == installation.project_path
+                )
+            ]
+            self._installations.append(installation)
+            self._commit()
 
     def remove(
         self,
@@ -517,31 +590,39 @@ class InstallationRegistry:
 
         Returns list of removed installations.
         """
-        removed = []
-        kept = []
-
-        for inst in self._installations:
-            matches = inst.module_name == module_name
-            if assistant:
-                matches = matches and inst.assistant == assistant
-            if scope:
-                matches = matches and inst.scope == scope
-            if project_path:
-                matches = matches and inst.project_path == project_path
-
-            if matches:
-                removed.append(inst)
-            else:
-                kept.append(inst)
-
-        self._installations = kept
-        self._save()
-        return removed
+        self._ensure_loaded()
+        with self._lock:
+            removed = []
+            kept = []
+
+            for inst in self._installations:
+                matches = inst.module_name == module_name
+                if assistant:
+                    matches = matches and inst.assistant == assistant
+                if scope:
+                    matches = matches and inst.scope == scope
+                if project_path:
+                    matches = matches and inst.project_path == project_path
+
+                if matches:
+                    removed.append(inst)
+                else:
+                    kept.append(inst)
+
+            self._installations = kept
+            self._commit()
+            return removed
 
     def find(self, module_name: str) -> list[Installation]:
         """Find all installations of a module."""
-        return [inst for inst in self._installations if inst.module_name == module_name]
+        self._ensure_loaded()
+        with self._lock:
+            return [
+                inst for inst in self._installations if inst.module_name == module_name
+            ]
 
     def all(self) -> list[Installation]:
         """Get all installations."""
-        return self._installations.copy()
+        self._ensure_loaded()
+        with self._lock:
+            return self._installations.copy()
@@ -32,6 +32,7 @@ from lola.exceptions import (
     SourceError,
     UnsupportedSourceError,
 )
+from lola.models import _YamlLoader
 
 SOURCE_TYPES = ["git", "zip", "tar", "folder", "zipurl", "tarurl"]
 
@@ -477,7 +478,7 @@ def load_source_info(module_path: Path) -> Optional[dict]:
     if not source_file.exists():
         return None
     with open(source_file, "r") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)
 
 
 def update_module(module_path: Path) -> str:
@@ -35,6 +35,7 @@ from lola.targets.opencode import OpenCodeTarget
 
 # Install functions and console (for test mocking)
 from lola.targets.install import (
+    _install_assistant_files,
     console,
     copy_module_to_local,
     get_registry,
@@ -87,6 +88,7 @@ __all__ = [
     "install_to_assistant",
     "uninstall_from_assistant",
     # Helpers (used by tests and cli/install.py)
+    "_install_assistant_files",
     "_get_content_path",
     "_get_skill_description",
     "_skill_source_dir",
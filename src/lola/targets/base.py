@@ -123,6 +123,11 @@ class AssistantTarget(ABC):
         """Generate skills as a batch (for managed section targets)."""
         ...
 
+    @abstractmethod
+    def get_skill_filename(self, skill_name: str) -> str:
+        """Get the file or directory name a skill is generated as."""
+        ...
+
     @abstractmethod
     def get_command_filename(self, module_name: str, cmd_name: str) -> str:
         """Get the filename for a command."""
@@ -238,11 +243,11 @@ class BaseAssistantTarget(AssistantTarget):
 
     def remove_skill(self, dest_path: Path, skill_name: str) -> bool:
         """Default: remove skill directory."""
-        skill_dir = dest_path / skill_name
-        if skill_dir.exists():
-            shutil.rmtree(skill_dir)
-            return True
-        return False
+        try:
+            shutil.rmtree(dest_path / skill_name)
+        except FileNotFoundError:
+            return False
+        return True
 
     def remove_instructions(
         self,
@@ -252,6 +257,10 @@ class BaseAssistantTarget(AssistantTarget):
         """Default: instructions removal not supported. Override in subclasses."""
         return False
 
+    def get_skill_filename(self, skill_name: str) -> str:
+        """Default: one directory per skill, named after it"""
+        return skill_name
+
     def get_command_filename(self, module_name: str, cmd_name: str) -> str:
         """Default: module.cmd.md (dot-separated)"""
         return f"{module_name}.{cmd_name}.md"
@@ -302,9 +311,7 @@ class BaseAssistantTarget(AssistantTarget):
         Returns True if removed or didn't exist (idempotent).
         """
         filename = self.get_command_filename(module_name, cmd_name)
-        cmd_file = dest_dir / filename
-        if cmd_file.exists():
-            cmd_file.unlink()
+        (dest_dir / filename).unlink(missing_ok=True)
         return True
 
     def remove_agent(
@@ -321,9 +328,7 @@ class BaseAssistantTarget(AssistantTarget):
         if not self.supports_agents:
             return True
         filename = self.get_agent_filename(module_name, agent_name)
-        agent_file = dest_dir / filename
-        if agent_file.exists():
-            agent_file.unlink()
+        (dest_dir / filename).unlink(missing_ok=True)
         return True
 
 
@@ -92,9 +92,15 @@ class CursorTarget(MCPSupportMixin, BaseAssistantTarget):
         mdc_lines.append("")
         mdc_lines.append(body)
 
-        (dest_path / f"{skill_name}.mdc").write_text("\n".join(mdc_lines))
+        (dest_path / self.get_skill_filename(skill_name)).write_text(
+            "\n".join(mdc_lines)
+        )
         return True
 
+    def get_skill_filename(self, skill_name: str) -> str:
+        """Cursor: one skill-name.mdc rule file per skill"""
+        return f"{skill_name}.mdc"
+
     def generate_command(
         self,
         source_path: Path,
@@ -137,16 +143,16 @@ class CursorTarget(MCPSupportMixin, BaseAssistantTarget):
 
     def remove_skill(self, dest_path: Path, skill_name: str) -> bool:
         """Remove .mdc file instead of directory."""
-        mdc_file = dest_path / f"{skill_name}.mdc"
-        if mdc_file.exists():
-            mdc_file.unlink()
-            return True
-        return False
+        try:
+            (dest_path / self.get_skill_filename(skill_name)).unlink()
+        except FileNotFoundError:
+            return False
+        return True
 
     def remove_instructions(self, dest_path: Path, module_name: str) -> bool:
         """Remove the module's instructions .mdc file."""
-        mdc_file = dest_path / f"{module_name}-instructions.mdc"
-        if mdc_file.exists():
-            mdc_file.unlink()
-            return True
-        return False
+        try:
+            (dest_path / f"{module_name}-instructions.mdc").unlink()
+        except FileNotFoundError:
+            return False
+        return True
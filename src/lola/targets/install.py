@@ -11,7 +11,10 @@ This module provides:
 from __future__ import annotations
 
 import json
+import os
 import shutil
+import stat
+import tempfile
 from pathlib import Path
 from typing import Optional
 
@@ -37,8 +40,31 @@ console = Console()
 # =============================================================================
 
 
+# Registry shared across calls within one process, keyed by the file's
+# (path, mtime, size) so external changes to installed.yml force a reload.
+_cached_registry: InstallationRegistry | None = None
+_cached_stat: tuple[str, int, int] | None = None
+
+
+def _registry_stat_key(path: Path) -> tuple[str, int, int]:
+    """Return a cache key describing the current state of the registry file."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return (str(path), -1, -1)
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
 def get_registry() -> InstallationRegistry:
-    return InstallationRegistry(config.INSTALLED_FILE)
+    """Get the installation registry, reusing the parsed file when unchanged."""
+    global _cached_registry, _cached_stat
+
+    path = config.INSTALLED_FILE
+    key = _registry_stat_key(path)
+    if _cached_registry is None or _cached_stat != key:
+        _cached_registry = InstallationRegistry(path)
+        _cached_stat = key
+    return _cached_registry
 
 
 # =============================================================================
@@ -46,20 +72,131 @@ def get_registry() -> InstallationRegistry:
 # =============================================================================
 
 
+try:
+    import fcntl
+
+    _FICLONE: int | None = getattr(fcntl, "FICLONE", None)
+except ImportError:  # pragma: no cover - not available on Windows
+    _FICLONE = None
+
+
+def _clone_file(src: str, dst: str) -> None:
+    """Copy a file, using a copy-on-write clone when the filesystem allows it.
+
+    The copy is written to a temporary file beside dst and renamed over it,
+    so a read-only or symlinked dst is replaced rather than written through.
+    """
+    fd, tmp = tempfile.mkstemp(
+        dir=os.path.dirname(dst), prefix=f".{os.path.basename(dst)}.", suffix=".tmp"
+    )
+    try:
+        cloned = False
+        with os.fdopen(fd, "wb") as fdst:
+            if _FICLONE is not None:
+                try:
+                    with open(src, "rb") as fsrc:
+                        fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                    cloned = True
+                except OSError:
+                    # Filesystem without reflink support (ext4, tmpfs, cross-device)
+                    pass
+        if cloned:
+            shutil.copystat(src, tmp)
+        else:
+            shutil.copy2(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _same_contents(a: str, b: str) -> bool:
+    """Compare two files byte for byte."""
+    with open(a, "rb") as fa, open(b, "rb") as fb:
+        while True:
+            chunk = fa.read(65536)
+            if chunk != fb.read(65536):
+                return False
+            if not chunk:
+                return True
+
+
+def _sync_file(src: str, dst: str) -> str:
+    """Copy src to dst unless dst is a regular file with the same bytes.
+
+    Timestamps are not trusted: tar extraction keeps archive mtimes, so a
+    changed file can have the same size and mtime as the previous copy.
+    filecmp.cmp is avoided because it caches results by (size, mtime).
+    """
+    try:
+        src_stat = os.stat(src)
+        # lstat: a symlink at dst is never treated as an up-to-date copy
+        dst_stat = os.lstat(dst)
+    except FileNotFoundError:
+        pass
+    else:
+        if (
+            stat.S_ISREG(dst_stat.st_mode)
+            and src_stat.st_size == dst_stat.st_size
+            and _same_contents(src, dst)
+        ):
+            return dst
+    _clone_file(src, dst)
+    return dst
+
+
+def _remove_stale_entries(src: Path, dest: Path) -> None:
+    """Remove files and directories under dest that are not present in src."""
+    for root, dirs, files in os.walk(dest):
+        src_root = src / os.path.relpath(root, dest)
+        for name in list(dirs):
+            path = os.path.join(root, name)
+            if os.path.islink(path):
+                os.unlink(path)
+                dirs.remove(name)
+            elif not (src_root / name).is_dir():
+                shutil.rmtree(path)
+                dirs.remove(name)
+        for name in files:
+            if not (src_root / name).is_file():
+                os.unlink(os.path.join(root, name))
+
+
+def _is_same_location(dest: Path, source: Path) -> bool:
+    """Check whether dest already is the source module directory.
+
+    A plain path comparison covers the common user-scope case without
+    touching the filesystem; samefile() catches symlinked or relative
+    spellings of the same directory.
+    """
+    if dest == source:
+        return True
+    try:
+        return os.path.samefile(dest, source)
+    except OSError:
+        return False
+
+
 def copy_module_to_local(module: Module, local_modules_path: Path) -> Path:
-    """Copy module to local .lola/modules directory."""
+    """Copy module to local .lola/modules directory.
+
+    An existing copy is synced in place: files whose size and mtime match
+    the source are left untouched, and entries removed from the source are
+    deleted from the copy.
+    """
     dest = local_modules_path / module.name
-    if dest.resolve() == module.path.resolve():
+    if _is_same_location(dest, module.path):
         return dest
 
     local_modules_path.mkdir(parents=True, exist_ok=True)
-    if dest.is_symlink() or dest.exists():
-        if dest.is_symlink():
-            dest.unlink()
-        else:
-            shutil.rmtree(dest)
-
-    shutil.copytree(module.path, dest)
+    if dest.is_symlink():
+        dest.unlink()
+    elif dest.is_dir():
+        _remove_stale_entries(module.path, dest)
+    elif dest.exists():
+        dest.unlink()
+
+    shutil.copytree(module.path, dest, copy_function=_sync_file, dirs_exist_ok=True)
     return dest
 
 
@@ -77,12 +214,8 @@ def _check_skill_exists(
     if target.uses_managed_section:
         # For managed sections, we allow overwriting since skills are grouped by module
         return False
-    else:
-        # For file-based targets, check if directory/file exists
-        if target.name == "cursor":
-            return (skill_dest / f"{skill_name}.mdc").exists()
-        else:
-            return (skill_dest / skill_name).exists()
+    # For file-based targets, check if directory/file exists
+    return (skill_dest / target.get_skill_filename(skill_name)).exists()
 
 
 def _install_skills(
@@ -109,7 +242,10 @@ def _install_skills(
         for skill in module.skills:
             source = _skill_source_dir(local_module_path, skill)
             if source.exists():
-                batch_skills.append((skill, _get_skill_description(source), source))
+                description = module.skill_descriptions.get(skill)
+                if description is None:
+                    description = _get_skill_description(source)
+                batch_skills.append((skill, description, source))
                 installed.append(skill)
             else:
                 failed.append(skill)
@@ -265,7 +401,7 @@ def _install_mcps(
     return [], list(module.mcps)
 
 
-def _print_summary(
+def _format_summary(
     assistant: str,
     installed_skills: list[str],
     installed_commands: list[str],
@@ -278,8 +414,8 @@ def _print_summary(
     failed_mcps: list[str],
     module_name: str,
     verbose: bool,
-) -> None:
-    """Print installation summary."""
+) -> str | None:
+    """Format the installation summary, or return None if nothing was installed."""
     if not (
         installed_skills
         or installed_commands
@@ -287,7 +423,7 @@ def _print_summary(
         or installed_mcps
         or has_instructions
     ):
-        return
+        return None
 
     parts: list[str] = []
     if installed_skills:
@@ -309,29 +445,25 @@ def _print_summary(
     if has_instructions:
         parts.append("instructions")
 
-    console.print(f"  [green]{assistant}[/green] [dim]({', '.join(parts)})[/dim]")
+    # Rendered as one block so Rich parses the markup in a single print
+    lines = [f"  [green]{assistant}[/green] [dim]({', '.join(parts)})[/dim]"]
 
     if verbose:
-        for skill in installed_skills:
-            console.print(f"    [green]{skill}[/green]")
-        for cmd in installed_commands:
-            console.print(f"    [green]/{module_name}.{cmd}[/green]")
-        for agent in installed_agents:
-            console.print(f"    [green]@{module_name}.{agent}[/green]")
-        for mcp in installed_mcps:
-            console.print(f"    [green]mcp:{mcp}[/green]")
+        lines.extend(f"    [green]{skill}[/green]" for skill in installed_skills)
+        lines.extend(
+            f"    [green]/{module_name}.{cmd}[/green]" for cmd in installed_commands
+        )
+        lines.extend(
+            f"    [green]@{module_name}.{agent}[/green]" for agent in installed_agents
+        )
+        lines.extend(f"    [green]mcp:{mcp}[/green]" for mcp in installed_mcps)
         if has_instructions:
-            console.print("    [green]instructions[/green]")
+            lines.append("    [green]instructions[/green]")
+
+    for name in (*failed_skills, *failed_commands, *failed_agents, *failed_mcps):
+        lines.append(f"    [red]{name}[/red] [dim](source not found)[/dim]")
 
-    if failed_skills or failed_commands or failed_agents or failed_mcps:
-        for skill in failed_skills:
-            console.print(f"    [red]{skill}[/red] [dim](source not found)[/dim]")
-        for cmd in failed_commands:
-            console.print(f"    [red]{cmd}[/red] [dim](source not found)[/dim]")
-        for agent in failed_agents:
-            console.print(f"    [red]{agent}[/red] [dim](source not found)[/dim]")
-        for mcp in failed_mcps:
-            console.print(f"    [red]{mcp}[/red] [dim](source not found)[/dim]")
+    return "\n".join(lines)
 
 
 def install_to_assistant(
@@ -345,6 +477,33 @@ def install_to_assistant(
     force: bool = False,
 ) -> int:
     """Install module to a specific assistant."""
+    count, summary, installation = _install_assistant_files(
+        module, assistant, scope, project_path, local_modules, verbose, force
+    )
+    if summary:
+        console.print(summary)
+    if installation:
+        registry.add(installation)
+    return count
+
+
+def _install_assistant_files(
+    module: Module,
+    assistant: str,
+    scope: str,
+    project_path: str | None,
+    local_modules: Path,
+    verbose: bool = False,
+    force: bool = False,
+    local_module_path: Path | None = None,
+) -> tuple[int, str | None, Installation | None]:
+    """Write a module's files for one assistant without printing or recording.
+
+    Returns the item count, the summary to print and the Installation to add
+    to the registry, so parallel installs can report in a fixed order. If
+    local_module_path is given, the module is assumed to already be copied
+    there and copy_module_to_local is skipped.
+    """
     # Late import to avoid circular imports - get_target is defined in __init__.py
     from lola.targets import get_target
 
@@ -353,7 +512,8 @@ def install_to_assistant(
     if scope != "project":
         raise ConfigurationError("Only project scope is supported")
 
-    local_module_path = copy_module_to_local(module, local_modules)
+    if local_module_path is None:
+        local_module_path = copy_module_to_local(module, local_modules)
 
     installed_skills, failed_skills = _install_skills(
         target, module, local_module_path, project_path, force
@@ -371,7 +531,7 @@ def install_to_assistant(
         target, module, local_module_path, project_path
     )
 
-    _print_summary(
+    summary = _format_summary(
         assistant,
         installed_skills,
         installed_commands,
@@ -386,6 +546,7 @@ def install_to_assistant(
         verbose,
     )
 
+    installation = None
     if (
         installed_skills
         or installed_commands
@@ -393,27 +554,26 @@ def install_to_assistant(
         or installed_mcps
         or instructions_installed
     ):
-        registry.add(
-            Installation(
-                module_name=module.name,
-                assistant=assistant,
-                scope=scope,
-                project_path=project_path,
-                skills=installed_skills,
-                commands=installed_commands,
-                agents=installed_agents,
-                mcps=installed_mcps,
-                has_instructions=instructions_installed,
-            )
+        installation = Installation(
+            module_name=module.name,
+            assistant=assistant,
+            scope=scope,
+            project_path=project_path,
+            skills=installed_skills,
+            commands=installed_commands,
+            agents=installed_agents,
+            mcps=installed_mcps,
+            has_instructions=instructions_installed,
         )
 
-    return (
+    count = (
         len(installed_skills)
         + len(installed_commands)
         + len(installed_agents)
         + len(installed_mcps)
         + (1 if instructions_installed else 0)
     )
+    return count, summary, installation
 
 
 # =============================================================================
@@ -563,19 +723,21 @@ def _print_uninstall_summary(
     if had_instructions:
         parts.append("instructions")
 
-    console.print(f"  [green]{assistant}[/green] [dim]({', '.join(parts)})[/dim]")
+    lines = [f"  [green]{assistant}[/green] [dim]({', '.join(parts)})[/dim]"]
 
     if verbose:
-        for skill in removed_skills:
-            console.print(f"    [dim]- {skill}[/dim]")
-        for cmd in removed_commands:
-            console.print(f"    [dim]- /{module_name}.{cmd}[/dim]")
-        for agent in removed_agents:
-            console.print(f"    [dim]- @{module_name}.{agent}[/dim]")
-        for mcp in removed_mcps:
-            console.print(f"    [dim]- mcp:{mcp}[/dim]")
+        lines.extend(f"    [dim]- {skill}[/dim]" for skill in removed_skills)
+        lines.extend(
+            f"    [dim]- /{module_name}.{cmd}[/dim]" for cmd in removed_commands
+        )
+        lines.extend(
+            f"    [dim]- @{module_name}.{agent}[/dim]" for agent in removed_agents
+        )
+        lines.extend(f"    [dim]- mcp:{mcp}[/dim]" for mcp in removed_mcps)
         if had_instructions:
-            console.print("    [dim]- instructions[/dim]")
+            lines.append("    [dim]- instructions[/dim]")
+
+    console.print("\n".join(lines))
 
 
 def uninstall_from_assistant(
@@ -5,6 +5,18 @@ from unittest.mock import patch
 import pytest
 from click.testing import CliRunner
 
+from lola.models import _YamlDumper
+
+
+def _write_yaml(path, data):
+    """Write data to path as block-style YAML with the libyaml dumper."""
+    import yaml
+
+    with open(path, "w") as f:
+        yaml.dump(
+            data, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False
+        )
+
 
 @pytest.fixture
 def cli_runner():
@@ -362,6 +374,27 @@ def registered_module_with_module_subdir(
     return dest
 
 
+@pytest.fixture(scope="session")
+def write_yaml():
+    """Provide a helper that writes a dict to a YAML file."""
+    return _write_yaml
+
+
+@pytest.fixture(scope="session")
+def sample_marketplace_yaml_bytes():
+    """Encoded marketplace catalog served by mocked urlopen calls."""
+    return (
+        b"name: Test Marketplace\n"
+        b"description: Test catalog\n"
+        b"version: 1.0.0\n"
+        b"modules:\n"
+        b"  - name: test-module\n"
+        b"    description: A test module\n"
+        b"    version: 1.0.0\n"
+        b"    repository: https://github.com/test/module.git\n"
+    )
+
+
 @pytest.fixture
 def marketplace_with_modules(tmp_path):
     """Create a marketplace with test modules."""
@@ -12,6 +12,7 @@ from lola.cli.install import (
 )
 from lola.market.manager import parse_market_ref
 from lola.models import Installation, InstallationRegistry
+from lola.targets import copy_module_to_local
 
 
 class TestInstallCmd:
@@ -66,6 +67,23 @@ class TestInstallCmd:
         assert result.exit_code == 1
         assert "does not exist" in result.output
 
+    def test_install_project_path_under_file(self, cli_runner, tmp_path):
+        """Fail cleanly when the project path runs through a regular file."""
+        modules_dir = tmp_path / ".lola" / "modules"
+        modules_dir.mkdir(parents=True)
+        (tmp_path / "somefile").write_text("")
+
+        with (
+            patch("lola.cli.install.MODULES_DIR", modules_dir),
+            patch("lola.cli.install.ensure_lola_dirs"),
+        ):
+            result = cli_runner.invoke(
+                install_cmd, ["mymodule", str(tmp_path / "somefile" / "sub")]
+            )
+
+        assert result.exit_code == 1
+        assert "does not exist" in result.output
+
     def test_install_module(self, cli_runner, sample_module, tmp_path):
         """Install a module successfully."""
         modules_dir = tmp_path / ".lola" / "modules"
@@ -99,6 +117,48 @@ class TestInstallCmd:
         assert "Installing" in result.output
         mock_install.assert_called_once()
 
+    def test_install_force_all_assistants(self, cli_runner, sample_module, tmp_path):
+        """Install with --force to all assistants records every installation in order."""
+        import time
+
+        from lola.targets import install as targets_install
+
+        modules_dir = tmp_path / ".lola" / "modules"
+        modules_dir.mkdir(parents=True)
+        installed_file = tmp_path / ".lola" / "installed.yml"
+        shutil.copytree(sample_module, modules_dir / "sample-module")
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+
+        real_install_skills = targets_install._install_skills
+
+        def slow_first_assistant(target, *args):
+            # Make the first assistant finish last
+            if target.name == "claude-code":
+                time.sleep(0.2)
+            return real_install_skills(target, *args)
+
+        registry = InstallationRegistry(installed_file)
+        with (
+            patch("lola.cli.install.MODULES_DIR", modules_dir),
+            patch("lola.cli.install.ensure_lola_dirs"),
+            patch("lola.cli.install.get_registry", return_value=registry),
+            patch.object(targets_install, "_install_skills", slow_first_assistant),
+        ):
+            result = cli_runner.invoke(
+                install_cmd, ["sample-module", "--force", str(project_dir)]
+            )
+
+        assistants = ["claude-code", "cursor", "gemini-cli", "opencode"]
+        assert result.exit_code == 0, result.output
+        assert "Installed to 4 assistants" in result.output
+        positions = [result.output.index(f"  {name} (") for name in assistants]
+        assert positions == sorted(positions)
+        reloaded = InstallationRegistry(installed_file)
+        assert [i.assistant for i in reloaded.find("sample-module")] == assistants
+        assert (project_dir / ".claude" / "skills" / "skill1" / "SKILL.md").exists()
+        assert (project_dir / ".cursor" / "rules" / "skill1.mdc").exists()
+
 
 class TestMarketplaceReference:
     """Tests for marketplace reference parsing."""
@@ -261,6 +321,46 @@ class TestUpdateCmd:
         assert result.exit_code == 0
         assert "Update complete" in result.output
 
+    def test_update_copies_module_once_per_project(
+        self, cli_runner, sample_module, tmp_path
+    ):
+        """Installations of one module in one project share a single copy."""
+        modules_dir = tmp_path / ".lola" / "modules"
+        modules_dir.mkdir(parents=True)
+        installed_file = tmp_path / ".lola" / "installed.yml"
+        shutil.copytree(sample_module, modules_dir / "sample-module")
+        project_dir = tmp_path / "project"
+        project_dir.mkdir()
+
+        registry = InstallationRegistry(installed_file)
+        for assistant in ("claude-code", "cursor"):
+            registry.add(
+                Installation(
+                    module_name="sample-module",
+                    assistant=assistant,
+                    scope="project",
+                    project_path=str(project_dir),
+                    skills=["skill1"],
+                )
+            )
+
+        with (
+            patch("lola.cli.install.MODULES_DIR", modules_dir),
+            patch("lola.cli.install.ensure_lola_dirs"),
+            patch("lola.cli.install.get_registry", return_value=registry),
+            patch(
+                "lola.cli.install.copy_module_to_local",
+                wraps=copy_module_to_local,
+            ) as mock_copy,
+        ):
+            result = cli_runner.invoke(update_cmd, ["sample-module"])
+
+        assert result.exit_code == 0, result.output
+        assert "Update complete" in result.output
+        mock_copy.assert_called_once()
+        assert (project_dir / ".claude" / "skills" / "skill1" / "SKILL.md").exists()
+        assert (project_dir / ".cursor" / "rules" / "skill1.mdc").exists()
+
     def test_update_removes_orphaned_commands(self, cli_runner, tmp_path):
         """Update removes orphaned command files when command removed from module."""
         from unittest.mock import MagicMock
@@ -334,6 +434,56 @@ class TestUpdateCmd:
         assert "orphaned" in result.output.lower()
         assert not orphan_cmd.exists(), "Orphaned command file should be removed"
 
+    def test_update_regenerates_files_newer_than_source(self, cli_runner, tmp_path):
+        """Update regenerates files even when the source carries an older mtime."""
+        import os
+        from unittest.mock import MagicMock
+
+        modules_dir = tmp_path / ".lola" / "modules"
+        modules_dir.mkdir(parents=True)
+        installed_file = tmp_path / ".lola" / "installed.yml"
+
+        module_dir = modules_dir / "mymodule"
+        commands_dir = module_dir / "commands"
+        commands_dir.mkdir(parents=True)
+        source_cmd = commands_dir / "cmd1.md"
+        source_cmd.write_text("---\ndescription: Cmd 1\n---\nContent")
+        os.utime(source_cmd, ns=(1_000_000_000, 1_000_000_000))
+
+        registry = InstallationRegistry(installed_file)
+        registry.add(
+            Installation(
+                module_name="mymodule",
+                assistant="claude-code",
+                scope="user",
+                commands=["cmd1"],
+            )
+        )
+
+        command_dest = tmp_path / "commands"
+        command_dest.mkdir()
+        generated_cmd = command_dest / "mymodule.cmd1.md"
+        generated_cmd.write_text("generated")
+
+        mock_target = MagicMock()
+        mock_target.get_command_path.return_value = command_dest
+        mock_target.get_agent_path.return_value = None
+        mock_target.get_mcp_path.return_value = None
+        mock_target.get_command_filename.side_effect = lambda m, c: f"{m}.{c}.md"
+        mock_target.generate_command.return_value = True
+
+        with (
+            patch("lola.cli.install.MODULES_DIR", modules_dir),
+            patch("lola.cli.install.ensure_lola_dirs"),
+            patch("lola.cli.install.get_registry", return_value=registry),
+            patch("lola.cli.install.get_local_modules_path", return_value=modules_dir),
+            patch("lola.cli.install.get_target", return_value=mock_target),
+        ):
+            result = cli_runner.invoke(update_cmd, ["mymodule"])
+
+        assert result.exit_code == 0
+        mock_target.generate_command.assert_called_once()
+
     def test_update_removes_orphaned_skills(self, cli_runner, tmp_path):
         """Update removes orphaned skill files when skill removed from module."""
         from unittest.mock import MagicMock
@@ -2,6 +2,8 @@
 
 from unittest.mock import patch, mock_open
 
+import pytest
+
 from lola.cli.market import market
 
 
@@ -29,22 +31,13 @@ class TestMarketAdd:
         assert result.exit_code == 0
         assert "Add a new marketplace" in result.output
 
-    def test_add_marketplace_success(self, cli_runner, tmp_path):
+    def test_add_marketplace_success(
+        self, cli_runner, tmp_path, sample_marketplace_yaml_bytes
+    ):
         """Add marketplace successfully."""
         market_dir = tmp_path / "market"
         cache_dir = market_dir / "cache"
-
-        yaml_content = (
-            "name: Test Marketplace\n"
-            "description: Test catalog\n"
-            "version: 1.0.0\n"
-            "modules:\n"
-            "  - name: test-module\n"
-            "    description: A test module\n"
-            "    version: 1.0.0\n"
-            "    repository: https://github.com/test/module.git\n"
-        )
-        mock_response = mock_open(read_data=yaml_content.encode())()
+        mock_response = mock_open(read_data=sample_marketplace_yaml_bytes)()
 
         with (
             patch("lola.cli.market.MARKET_DIR", market_dir),
@@ -59,13 +52,13 @@ class TestMarketAdd:
         assert "Added marketplace 'official'" in result.output
         assert "1 modules" in result.output
 
-    def test_add_marketplace_duplicate(self, cli_runner, tmp_path):
+    def test_add_marketplace_duplicate(
+        self, cli_runner, tmp_path, sample_marketplace_yaml_bytes
+    ):
         """Adding duplicate marketplace shows warning."""
         market_dir = tmp_path / "market"
         cache_dir = market_dir / "cache"
-
-        yaml_content = "name: Test\ndescription: Test\nversion: 1.0.0\nmodules: []\n"
-        mock_response = mock_open(read_data=yaml_content.encode())()
+        mock_response = mock_open(read_data=sample_marketplace_yaml_bytes)()
 
         with (
             patch("lola.cli.market.MARKET_DIR", market_dir),
@@ -107,7 +100,15 @@ class TestMarketAdd:
         assert result.exit_code == 0
         assert "Error:" in result.output
 
-    def test_add_marketplace_invalid_name(self, cli_runner, tmp_path):
+    @pytest.mark.parametrize(
+        "name, message",
+        [
+            ("foo/bar", "path separators not allowed"),
+            (".hidden", "cannot start with dot"),
+            ("..", "path traversal not allowed"),
+        ],
+    )
+    def test_add_marketplace_invalid_name(self, cli_runner, tmp_path, name, message):
         """Reject invalid marketplace names."""
         market_dir = tmp_path / "market"
         cache_dir = market_dir / "cache"
@@ -116,26 +117,12 @@ class TestMarketAdd:
             patch("lola.cli.market.MARKET_DIR", market_dir),
             patch("lola.cli.market.CACHE_DIR", cache_dir),
         ):
-            # Test path separator
-            result = cli_runner.invoke(
-                market, ["add", "foo/bar", "https://example.com/mkt.yml"]
-            )
-            assert result.exit_code == 0
-            assert "path separators not allowed" in result.output
-
-            # Test dot prefix
             result = cli_runner.invoke(
-                market, ["add", ".hidden", "https://example.com/mkt.yml"]
+                market, ["add", name, "https://example.com/mkt.yml"]
             )
-            assert result.exit_code == 0
-            assert "cannot start with dot" in result.output
 
-            # Test path traversal
-            result = cli_runner.invoke(
-                market, ["add", "..", "https://example.com/mkt.yml"]
-            )
-            assert result.exit_code == 0
-            assert "path traversal not allowed" in result.output
+        assert result.exit_code == 0
+        assert message in result.output
 
 
 class TestMarketLs:
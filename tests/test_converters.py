@@ -145,3 +145,9 @@ Do something with $ARGUMENTS.
         assert claude.get_command_filename("mod", "cmd") == "mod.cmd.md"
         assert cursor.get_command_filename("mod", "cmd") == "mod.cmd.md"
         assert gemini.get_command_filename("mod", "cmd") == "mod.cmd.toml"
+
+    def test_get_skill_filename(self):
+        """Get correct skill file or directory name for each assistant."""
+        assert get_target("claude-code").get_skill_filename("skill") == "skill"
+        assert get_target("cursor").get_skill_filename("skill") == "skill.mdc"
+        assert get_target("opencode").get_skill_filename("skill") == "skill"
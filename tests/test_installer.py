@@ -1,10 +1,12 @@
 """Tests for the core/installer module."""
 
+import os
+import shutil
 from unittest.mock import patch, MagicMock
 
 
 from lola.targets import get_registry, copy_module_to_local, install_to_assistant
-from lola.models import Module, InstallationRegistry
+from lola.models import Installation, Module, InstallationRegistry
 
 
 class TestGetRegistry:
@@ -17,6 +19,38 @@ class TestGetRegistry:
 
         assert isinstance(registry, InstallationRegistry)
 
+    def test_reuses_registry_when_file_unchanged(self, tmp_path):
+        """Returns the same registry while installed.yml is unchanged."""
+        installed_file = tmp_path / "installed.yml"
+        with patch("lola.config.INSTALLED_FILE", installed_file):
+            first = get_registry()
+            second = get_registry()
+
+        assert first is second
+
+    def test_reloads_registry_when_file_changes(self, tmp_path):
+        """Returns a fresh registry after installed.yml is modified."""
+        installed_file = tmp_path / "installed.yml"
+        with patch("lola.config.INSTALLED_FILE", installed_file):
+            first = get_registry()
+            InstallationRegistry(installed_file).add(
+                Installation("mod1", "claude-code", "project", "/p")
+            )
+            second = get_registry()
+
+        assert first is not second
+        assert len(second.find("mod1")) == 1
+
+    def test_reloads_registry_when_path_changes(self, tmp_path):
+        """Returns a different registry when INSTALLED_FILE points elsewhere."""
+        with patch("lola.config.INSTALLED_FILE", tmp_path / "a.yml"):
+            first = get_registry()
+        with patch("lola.config.INSTALLED_FILE", tmp_path / "b.yml"):
+            second = get_registry()
+
+        assert first is not second
+        assert second.path == tmp_path / "b.yml"
+
 
 class TestCopyModuleToLocal:
     """Tests for copy_module_to_local()."""
@@ -55,6 +89,22 @@ class TestCopyModuleToLocal:
 
         assert result == module_dir
 
+    def test_symlinked_modules_dir_is_same_path(self, tmp_path):
+        """A modules dir reached through a symlink is not copied onto itself."""
+        real_modules = tmp_path / "real"
+        module_dir = real_modules / "mymodule"
+        module_dir.mkdir(parents=True)
+        (module_dir / "SKILL.md").write_text("# My Skill")
+        link_modules = tmp_path / "link"
+        link_modules.symlink_to(real_modules)
+
+        module = Module(name="mymodule", path=module_dir, content_path=module_dir)
+
+        result = copy_module_to_local(module, link_modules)
+
+        assert result == link_modules / "mymodule"
+        assert (module_dir / "SKILL.md").read_text() == "# My Skill"
+
     def test_overwrites_existing(self, tmp_path):
         """Overwrites existing module directory."""
         # Create source module
@@ -77,6 +127,118 @@ class TestCopyModuleToLocal:
         assert (result / "new.txt").exists()
         assert not (result / "old.txt").exists()
 
+    def test_skips_unchanged_files(self, tmp_path):
+        """Leaves files untouched when their bytes match the source."""
+        source_dir = tmp_path / "source" / "mymodule"
+        source_dir.mkdir(parents=True)
+        (source_dir / "SKILL.md").write_text("# My Skill")
+
+        module = Module(name="mymodule", path=source_dir, content_path=source_dir)
+        local_modules = tmp_path / "local" / ".lola" / "modules"
+
+        result = copy_module_to_local(module, local_modules)
+        inode = (result / "SKILL.md").stat().st_ino
+
+        with patch("lola.targets.install._clone_file") as mock_clone:
+            copy_module_to_local(module, local_modules)
+
+        mock_clone.assert_not_called()
+        assert (result / "SKILL.md").stat().st_ino == inode
+
+    def test_updates_changed_files(self, tmp_path):
+        """Recopies files whose contents changed in the source."""
+        source_dir = tmp_path / "source" / "mymodule"
+        source_dir.mkdir(parents=True)
+        skill_file = source_dir / "SKILL.md"
+        skill_file.write_text("# My Skill")
+
+        module = Module(name="mymodule", path=source_dir, content_path=source_dir)
+        local_modules = tmp_path / "local" / ".lola" / "modules"
+
+        copy_module_to_local(module, local_modules)
+        skill_file.write_text("# My Updated Skill")
+
+        result = copy_module_to_local(module, local_modules)
+
+        assert (result / "SKILL.md").read_text() == "# My Updated Skill"
+
+    def test_updates_changed_file_with_same_size_and_mtime(self, tmp_path):
+        """Recopies a changed file even when its size and mtime are unchanged."""
+        source_dir = tmp_path / "source" / "mymodule"
+        source_dir.mkdir(parents=True)
+        skill_file = source_dir / "SKILL.md"
+        skill_file.write_text("version 1.0.1")
+        os.utime(skill_file, ns=(1_000_000_000, 1_000_000_000))
+
+        module = Module(name="mymodule", path=source_dir, content_path=source_dir)
+        local_modules = tmp_path / "local" / ".lola" / "modules"
+
+        copy_module_to_local(module, local_modules)
+        skill_file.write_text("version 1.0.2")
+        os.utime(skill_file, ns=(1_000_000_000, 1_000_000_000))
+
+        result = copy_module_to_local(module, local_modules)
+
+        assert (result / "SKILL.md").read_text() == "version 1.0.2"
+
+    def test_updates_read_only_copy(self, tmp_path):
+        """Recopies a file whose earlier copy kept a read-only mode."""
+        source_dir = tmp_path / "source" / "mymodule"
+        source_dir.mkdir(parents=True)
+        skill_file = source_dir / "SKILL.md"
+        skill_file.write_text("# My Skill")
+        skill_file.chmod(0o444)
+
+        module = Module(name="mymodule", path=source_dir, content_path=source_dir)
+        local_modules = tmp_path / "local" / ".lola" / "modules"
+
+        copy_module_to_local(module, local_modules)
+        skill_file.chmod(0o644)
+        skill_file.write_text("# My Updated Skill")
+        skill_file.chmod(0o444)
+
+        result = copy_module_to_local(module, local_modules)
+
+        assert (result / "SKILL.md").read_text() == "# My Updated Skill"
+
+    def test_replaces_symlinked_file_without_writing_through(self, tmp_path):
+        """A symlink inside the copy is replaced, leaving its target alone."""
+        source_dir = tmp_path / "source" / "mymodule"
+        source_dir.mkdir(parents=True)
+        (source_dir / "SKILL.md").write_text("# My Skill")
+
+        module = Module(name="mymodule", path=source_dir, content_path=source_dir)
+        local_modules = tmp_path / "local" / ".lola" / "modules"
+
+        result = copy_module_to_local(module, local_modules)
+        outside = tmp_path / "outside.md"
+        outside.write_text("outside")
+        (result / "SKILL.md").unlink()
+        (result / "SKILL.md").symlink_to(outside)
+
+        copy_module_to_local(module, local_modules)
+
+        assert not (result / "SKILL.md").is_symlink()
+        assert (result / "SKILL.md").read_text() == "# My Skill"
+        assert outside.read_text() == "outside"
+
+    def test_removes_stale_directories(self, tmp_path):
+        """Removes directories that no longer exist in the source."""
+        source_dir = tmp_path / "source" / "mymodule"
+        (source_dir / "skills" / "old").mkdir(parents=True)
+        (source_dir / "skills" / "old" / "SKILL.md").write_text("# Old")
+
+        module = Module(name="mymodule", path=source_dir, content_path=source_dir)
+        local_modules = tmp_path / "local" / ".lola" / "modules"
+
+        copy_module_to_local(module, local_modules)
+        shutil.rmtree(source_dir / "skills" / "old")
+
+        result = copy_module_to_local(module, local_modules)
+
+        assert (result / "skills").is_dir()
+        assert not (result / "skills" / "old").exists()
+
     def test_removes_existing_symlink(self, tmp_path):
         """Removes existing symlink before copying."""
         # Create source module
@@ -236,6 +236,7 @@ class TestMarketplaceRegistryRemove:
         cache_dir = marketplace_with_modules["cache_dir"]
 
         registry = MarketplaceRegistry(market_dir, cache_dir)
+        (cache_dir / "official.parsed.json").write_bytes(b"parsed")
         registry.remove("official")
 
         captured = capsys.readouterr()
@@ -246,6 +247,7 @@ class TestMarketplaceRegistryRemove:
         cache_file = cache_dir / "official.yml"
         assert not ref_file.exists()
         assert not cache_file.exists()
+        assert not (cache_dir / "official.parsed.json").exists()
 
     def test_remove_not_found(self, tmp_path, capsys):
         """Remove non-existent marketplace shows error."""
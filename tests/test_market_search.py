@@ -4,6 +4,7 @@ from rich.console import Console
 
 from lola.market.search import (
     get_enabled_marketplaces,
+    iter_enabled_marketplaces,
     match_module,
     format_search_result,
     search_market,
@@ -26,10 +27,8 @@ class TestGetEnabledMarketplaces:
         assert name == "official"
         assert len(marketplace.modules) == 2
 
-    def test_get_enabled_skips_disabled(self, marketplace_with_modules):
+    def test_get_enabled_skips_disabled(self, marketplace_with_modules, write_yaml):
         """Skip disabled marketplaces."""
-        import yaml
-
         market_dir = marketplace_with_modules["market_dir"]
         cache_dir = marketplace_with_modules["cache_dir"]
 
@@ -47,10 +46,8 @@ class TestGetEnabledMarketplaces:
             "modules": [{"name": "test-module"}],
         }
 
-        with open(market_dir / "disabled-market.yml", "w") as f:
-            yaml.dump(disabled_ref, f)
-        with open(cache_dir / "disabled-market.yml", "w") as f:
-            yaml.dump(disabled_cache, f)
+        write_yaml(market_dir / "disabled-market.yml", disabled_ref)
+        write_yaml(cache_dir / "disabled-market.yml", disabled_cache)
 
         marketplaces = get_enabled_marketplaces(market_dir, cache_dir)
 
@@ -58,6 +55,57 @@ class TestGetEnabledMarketplaces:
         assert len(marketplaces) == 1
         assert marketplaces[0][1] == "official"
 
+    def test_disabled_reference_is_not_parsed(self, marketplace_with_modules):
+        """Disabled references are recognised without a YAML parse."""
+        from unittest.mock import patch
+
+        from lola.models import Marketplace
+
+        market_dir = marketplace_with_modules["market_dir"]
+        cache_dir = marketplace_with_modules["cache_dir"]
+        (market_dir / "off.yml").write_text(
+            "enabled: false\nname: off\nurl: https://example.com/off.yml\n"
+        )
+
+        with patch.object(
+            Marketplace, "from_reference", wraps=Marketplace.from_reference
+        ) as mock_from_reference:
+            marketplaces = get_enabled_marketplaces(market_dir, cache_dir)
+
+        assert [name for _, name in marketplaces] == ["official"]
+        parsed = [c.args[0].name for c in mock_from_reference.call_args_list]
+        assert parsed == ["official.yml"]
+
+    def test_iter_enabled_marketplaces_is_lazy(self, marketplace_with_modules):
+        """The iterator yields the same marketplaces without building a list."""
+        from collections.abc import Iterator
+
+        market_dir = marketplace_with_modules["market_dir"]
+        cache_dir = marketplace_with_modules["cache_dir"]
+
+        it = iter_enabled_marketplaces(market_dir, cache_dir)
+
+        assert isinstance(it, Iterator)
+        assert [name for _, name in it] == ["official"]
+
+    def test_loads_several_marketplaces(self, marketplace_with_modules):
+        """Several enabled marketplaces load together, fetching missing caches."""
+        from unittest.mock import mock_open, patch
+
+        market_dir = marketplace_with_modules["market_dir"]
+        cache_dir = marketplace_with_modules["cache_dir"]
+        (market_dir / "community.yml").write_text(
+            "name: community\nurl: https://example.com/community.yml\n"
+        )
+        yaml_content = "name: Community\nmodules:\n  - name: docker-tools\n"
+        mock_response = mock_open(read_data=yaml_content.encode())()
+
+        with patch("urllib.request.urlopen", return_value=mock_response):
+            marketplaces = get_enabled_marketplaces(market_dir, cache_dir)
+
+        assert {name for _, name in marketplaces} == {"official", "community"}
+        assert (cache_dir / "community.yml").exists()
+
     def test_get_enabled_empty(self, tmp_path):
         """Return empty list when no marketplaces."""
         market_dir = tmp_path / "market"
@@ -69,9 +117,102 @@ class TestGetEnabledMarketplaces:
 
         assert marketplaces == []
 
+    def test_reuses_parsed_files_until_changed(self, marketplace_with_modules):
+        """Unchanged marketplace files are parsed once; edits force a reparse."""
+        from unittest.mock import patch
+
+        from lola.models import Marketplace
+
+        market_dir = marketplace_with_modules["market_dir"]
+        cache_dir = marketplace_with_modules["cache_dir"]
+
+        with patch.object(
+            Marketplace, "from_cache", wraps=Marketplace.from_cache
+        ) as mock_from_cache:
+            get_enabled_marketplaces(market_dir, cache_dir)
+            get_enabled_marketplaces(market_dir, cache_dir)
+            assert mock_from_cache.call_count == 1
+
+            cache_file = cache_dir / "official.yml"
+            cache_file.write_text(cache_file.read_text() + "\n# edited\n")
+            marketplaces = get_enabled_marketplaces(market_dir, cache_dir)
+            assert mock_from_cache.call_count == 2
+
+        assert len(marketplaces[0][0].modules) == 2
+
+    def test_parsed_sidecar_skips_yaml_in_new_process(self, marketplace_with_modules):
+        """A fresh process loads the parsed sidecar instead of the YAML."""
+        from unittest.mock import patch
+
+        from lola.market import search
+        from lola.models import Marketplace
+
+        market_dir = marketplace_with_modules["market_dir"]
+        cache_dir = marketplace_with_modules["cache_dir"]
+
+        get_enabled_marketplaces(market_dir, cache_dir)
+        assert (cache_dir / "official.parsed.json").exists()
+
+        with (
+            patch.dict(search._CACHE_CACHE, clear=True),
+            patch.object(Marketplace, "from_cache") as mock_from_cache,
+        ):
+            marketplaces = get_enabled_marketplaces(market_dir, cache_dir)
+
+        mock_from_cache.assert_not_called()
+        assert len(marketplaces[0][0].modules) == 2
+
+    def test_sidecar_from_other_schema_is_rebuilt(self, marketplace_with_modules):
+        """A sidecar written with another schema version is ignored."""
+        import json
+        from unittest.mock import patch
+
+        from lola.market import search
+
+        market_dir = marketplace_with_modules["market_dir"]
+        cache_dir = marketplace_with_modules["cache_dir"]
+        sidecar = cache_dir / "official.parsed.json"
+
+        get_enabled_marketplaces(market_dir, cache_dir)
+        payload = json.loads(sidecar.read_text())
+        payload["schema"] = 0
+        payload["marketplace"]["modules"] = []
+        sidecar.write_text(json.dumps(payload))
+
+        with patch.dict(search._CACHE_CACHE, clear=True):
+            marketplaces = get_enabled_marketplaces(market_dir, cache_dir)
+
+        assert len(marketplaces[0][0].modules) == 2
+        assert json.loads(sidecar.read_text())["schema"] != 0
+
+    def test_corrupt_sidecar_is_rebuilt(self, marketplace_with_modules):
+        """An unreadable sidecar falls back to the YAML and is rewritten."""
+        market_dir = marketplace_with_modules["market_dir"]
+        cache_dir = marketplace_with_modules["cache_dir"]
+        sidecar = cache_dir / "official.parsed.json"
+        sidecar.write_bytes(b"not json")
+
+        marketplaces = get_enabled_marketplaces(market_dir, cache_dir)
+
+        assert len(marketplaces[0][0].modules) == 2
+        assert sidecar.read_bytes() != b"not json"
+
+    def test_precomputes_search_text_on_load(self, marketplace_with_modules):
+        """Modules carry their search text and short description once loaded."""
+        market_dir = marketplace_with_modules["market_dir"]
+        cache_dir = marketplace_with_modules["cache_dir"]
+
+        marketplaces = get_enabled_marketplaces(market_dir, cache_dir)
+
+        for module in marketplaces[0][0].modules:
+            assert module["_search_blob"] == module["_search_blob"].lower()
+            assert module["name"].lower() in module["_search_blob"]
+            assert module["_description_short"] == module["description"]
+
     def test_cache_recovery(self, marketplace_with_modules):
         """Recover missing cache by re-downloading."""
-        from unittest.mock import patch, mock_open
+        import io
+        from unittest.mock import patch
 
         market_dir = marketplace_with_modules["market_dir"]
         cache_dir = marketplace_with_modules["cache_dir"]
@@ -79,19 +220,21 @@ class TestGetEnabledMarketplaces:
         cache_file = cache_dir / "official.yml"
         cache_file.unlink()
 
-        yaml_content = (
-            "name: Official Marketplace\n"
-            "description: Official catalog\n"
-            "version: 1.0.0\n"
-            "modules:\n"
-            "  - name: git-tools\n"
-            "    description: Git utilities\n"
-            "    version: 1.0.0\n"
-            "    repository: https://github.com/test/git-tools.git\n"
+        yaml_bytes = (
+            b"name: Official Marketplace\n"
+            b"description: Official catalog\n"
+            b"version: 1.0.0\n"
+            b"modules:\n"
+            b"  - name: git-tools\n"
+            b"    description: Git utilities\n"
+            b"    version: 1.0.0\n"
+            b"    repository: https://github.com/test/git-tools.git\n"
         )
-        mock_response = mock_open(read_data=yaml_content.encode())()
 
-        with patch("urllib.request.urlopen", return_value=mock_response):
+        def fake_urlopen(url, timeout=None):
+            return io.BytesIO(yaml_bytes)
+
+        with patch("urllib.request.urlopen", fake_urlopen):
             marketplaces = get_enabled_marketplaces(market_dir, cache_dir)
 
         assert len(marketplaces) == 1
@@ -179,6 +322,22 @@ class TestMatchModule:
         assert match_module(module, "python") is False
         assert match_module(module, "docker") is False
 
+    def test_empty_query_matches_everything(self):
+        """An empty query matches any module, even one without fields."""
+        assert match_module({}, "") is True
+        assert match_module({"name": "git-tools"}, "") is True
+
+    def test_no_match_across_fields(self):
+        """A query spanning two fields does not match."""
+        module = {
+            "name": "git-tools",
+            "description": "Git utilities",
+            "tags": ["git", "vcs"],
+        }
+
+        assert match_module(module, "toolsgit") is False
+        assert match_module(module, "gitvcs") is False
+
 
 class TestFormatSearchResult:
     """Tests for format_search_result()."""
@@ -253,6 +412,28 @@ class TestSearchMarket:
         names = {r["name"] for r in results}
         assert names == {"git-tools", "python-utils"}
 
+    def test_search_cache_dropped_when_file_changes(self, marketplace_with_modules):
+        """Edited cache files are searched afresh."""
+        import os
+
+        import yaml
+
+        market_dir = marketplace_with_modules["market_dir"]
+        cache_dir = marketplace_with_modules["cache_dir"]
+        cache_file = cache_dir / "official.yml"
+
+        assert search_market("rust", market_dir, cache_dir) == []
+
+        data = yaml.safe_load(cache_file.read_text())
+        data["modules"].append({"name": "rust-tools", "version": "0.1.0"})
+        cache_file.write_text(yaml.dump(data))
+        st = cache_file.stat()
+        os.utime(cache_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        results = search_market("rust", market_dir, cache_dir)
+
+        assert [r["name"] for r in results] == ["rust-tools"]
+
     def test_search_no_matches(self, marketplace_with_modules):
         """Search returns empty list when no matches."""
         market_dir = marketplace_with_modules["market_dir"]
@@ -323,6 +504,61 @@ class TestDisplayMarket:
         assert "Found 1 module" in captured.out
         assert "git-tools" in captured.out
 
+    def test_display_many_results_as_plain_rows(self, capsys):
+        """Large result sets are written as tab-separated rows."""
+        results = [
+            {
+                "name": f"mod-{i}",
+                "description": "[bold]not markup[/bold]",
+                "version": "1.0.0",
+                "marketplace": "official",
+            }
+            for i in range(501)
+        ]
+
+        console = Console()
+        display_market(results, "mod", console)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert "Found 501 modules" in lines[1]
+        assert "Module\tVersion\tMarketplace\tDescription" in lines
+        assert "mod-500\t1.0.0\tofficial\t[bold]not markup[/bold]" in lines
+
+    def test_display_plain_rows_when_not_terminal(self, capsys):
+        """Piped output is written as tab-separated rows."""
+        results = [
+            {
+                "name": "git-tools",
+                "description": "Git utilities",
+                "version": "1.0.0",
+                "marketplace": "official",
+            }
+        ]
+
+        console = Console(force_terminal=False)
+        display_market(results, "git", console)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert "git-tools\t1.0.0\tofficial\tGit utilities" in lines
+
+    def test_display_table_when_terminal(self, capsys):
+        """Interactive output keeps the Rich table."""
+        results = [
+            {
+                "name": "git-tools",
+                "description": "Git utilities",
+                "version": "1.0.0",
+                "marketplace": "official",
+            }
+        ]
+
+        console = Console(force_terminal=True, width=120)
+        display_market(results, "git", console)
+
+        out = capsys.readouterr().out
+        assert "git-tools" in out
+        assert "\t" not in out
+
     def test_display_no_results(self, capsys):
         """Display message when no results found."""
         console = Console()
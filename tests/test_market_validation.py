@@ -53,3 +53,9 @@ class TestValidateMarketplaceName:
             validate_marketplace_name(".hidden")
 
         assert "cannot start with dot" in str(exc_info.value)
+
+    def test_inner_dots_and_spaces_allowed(self):
+        """Only leading dots and separators are rejected."""
+        assert validate_marketplace_name("v1.0") == "v1.0"
+        assert validate_marketplace_name("foo..bar") == "foo..bar"
+        assert validate_marketplace_name("my market") == "my market"
@@ -1,5 +1,9 @@
 """Tests for the models module."""
 
+import os
+from unittest.mock import patch
+
+import pytest
 import yaml
 
 from lola.models import (
@@ -326,6 +330,7 @@ Content.
         is_valid, errors = module.validate()
         assert is_valid is True
         assert errors == []
+        assert module.skill_descriptions == {"skill1": "A skill"}
 
     def test_validate_skill_missing_description(self, tmp_path):
         """Validate module with skill missing description in frontmatter."""
@@ -552,3 +557,112 @@ class TestInstallationRegistry:
 
         registry = InstallationRegistry(registry_path)
         assert len(registry.all()) == 2
+
+    def test_load_is_deferred_until_first_access(self, tmp_path):
+        """Registry file is not read until installations are accessed."""
+        registry_path = tmp_path / "installed.yml"
+        registry_path.write_text(
+            yaml.dump(
+                {
+                    "version": "1.0",
+                    "installations": [
+                        {"module": "mod1", "assistant": "claude-code", "scope": "user"}
+                    ],
+                }
+            )
+        )
+
+        registry = InstallationRegistry(registry_path)
+        assert registry._loaded is False
+
+        assert len(registry.find("mod1")) == 1
+        assert registry._loaded is True
+
+    def test_failed_load_raises_again(self, tmp_path):
+        """A registry that failed to parse is not treated as empty."""
+        registry_path = tmp_path / "installed.yml"
+        original = "installations: [\n  {module: mod1\n"
+        registry_path.write_text(original)
+
+        registry = InstallationRegistry(registry_path)
+        with pytest.raises(yaml.YAMLError):
+            registry.all()
+        with pytest.raises(yaml.YAMLError):
+            registry.all()
+        with pytest.raises(yaml.YAMLError):
+            registry.add(Installation("mod2", "claude-code", "user"))
+
+        assert registry._loaded is False
+        assert registry_path.read_text() == original
+
+    def test_transaction_defers_save(self, tmp_path):
+        """Changes inside a transaction are written once on exit."""
+        registry_path = tmp_path / "installed.yml"
+        registry = InstallationRegistry(registry_path)
+
+        with (
+            patch.object(registry, "_save", wraps=registry._save) as mock_save,
+            registry.transaction(),
+        ):
+            registry.add(Installation("mod1", "claude-code", "project", "/p"))
+            registry.add(Installation("mod1", "cursor", "project", "/p"))
+            registry.remove("mod1", assistant="cursor")
+            assert not registry_path.exists()
+
+        mock_save.assert_called_once()
+        reloaded = InstallationRegistry(registry_path)
+        assert [i.assistant for i in reloaded.all()] == ["claude-code"]
+
+    def test_transaction_saves_on_error(self, tmp_path):
+        """Changes made before an exception are still written."""
+        registry_path = tmp_path / "installed.yml"
+        registry = InstallationRegistry(registry_path)
+
+        with pytest.raises(RuntimeError), registry.transaction():
+            registry.add(Installation("mod1", "claude-code", "project", "/p"))
+            raise RuntimeError("boom")
+
+        assert len(InstallationRegistry(registry_path).all()) == 1
+
+    def test_nested_transaction_saves_on_outer_exit(self, tmp_path):
+        """Only the outermost transaction triggers a write."""
+        registry_path = tmp_path / "installed.yml"
+        registry = InstallationRegistry(registry_path)
+
+        with registry.transaction():
+            with registry.transaction():
+                registry.add(Installation("mod1", "claude-code", "project", "/p"))
+            assert not registry_path.exists()
+
+        assert registry_path.exists()
+
+    def test_save_replaces_file_atomically(self, tmp_path):
+        """Saving writes through a temporary file that is renamed into place."""
+        registry_path = tmp_path / "installed.yml"
+        registry = InstallationRegistry(registry_path)
+
+        with patch("lola.models.os.replace", wraps=os.replace) as mock_replace:
+            registry.add(Installation("mod1", "claude-code", "project", "/p"))
+
+        mock_replace.assert_called_once_with(
+            tmp_path / "installed.yml.tmp", registry_path
+        )
+        assert not (tmp_path / "installed.yml.tmp").exists()
+        data = yaml.safe_load(registry_path.read_text())
+        assert data["installations"][0]["module"] == "mod1"
+
+    def test_failed_save_keeps_existing_file(self, tmp_path):
+        """A failed write leaves the previous registry file intact."""
+        registry_path = tmp_path / "installed.yml"
+        registry = InstallationRegistry(registry_path)
+        registry.add(Installation("mod1", "claude-code", "project", "/p"))
+        original = registry_path.read_text()
+
+        with (
+            patch("lola.models.yaml.dump", side_effect=RuntimeError("disk full")),
+            pytest.raises(RuntimeError),
+        ):
+            registry.add(Installation("mod2", "claude-code", "project", "/p"))
+
+        assert registry_path.read_text() == original
+        assert not (tmp_path / "installed.yml.tmp").exists()